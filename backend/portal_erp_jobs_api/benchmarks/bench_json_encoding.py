@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: encode time of a 100-job listing page
+
+Compares Flask's default stdlib provider on the previous payload (dates
+already formatted by to_dict(); the isoformat() calls themselves are not
+timed, so the comparison is conservative) with FastJSONProvider on raw
+datetimes (orjson when installed).
+
+Usage (from backend/portal_erp_jobs_api):
+    python benchmarks/bench_json_encoding.py [--jobs 100] [--rounds 2000]
+"""
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from src.services.json_provider import FastJSONProvider, orjson
+
+
+def build_page(jobs):
+    """Listing payload shaped like GET /api/jobs/ (dates as datetime)"""
+    now = datetime(2026, 10, 18, 12, 30, 45, 123456)
+    items = []
+    for i in range(jobs):
+        items.append({
+            'id': i + 1,
+            'company_id': i % 37 + 1,
+            'company_name': f'Empresa {i % 37} Consultoria ERP',
+            'title': f'Consultor SAP FI/CO Sênior {i}',
+            'area': 'Consultoria & ERP',
+            'area_id': 2,
+            'area_info': {'id': 2, 'name': 'Consultoria & ERP', 'icon': 'briefcase', 'color': '#F7941D'},
+            'seniority_level': 'senior',
+            'work_modality': 'hybrid',
+            'contract_type': 'clt',
+            'min_salary': 12000.0 + i,
+            'max_salary': 18000.5 + i,
+            'salary': f'R$ {12000 + i:,} - R$ {18000 + i:,}'.replace(',', '.'),
+            'salary_currency': 'BRL',
+            'city': 'São Paulo',
+            'state': 'SP',
+            'country': 'Brasil',
+            'location': 'São Paulo, SP',
+            'is_active': True,
+            'is_company_hidden': False,
+            'created_at': now - timedelta(hours=i),
+            'updated_at': now - timedelta(minutes=i),
+            'applications_count': i * 3,
+            'skills': ['SAP FI', 'SAP CO', 'ABAP', 'S/4HANA', 'SQL'],
+        })
+    return {
+        'jobs': items,
+        'total': 5000,
+        'pages': 50,
+        'current_page': 1,
+        'per_page': jobs,
+        'filters_applied': {'query': '', 'area': '', 'level': ''},
+    }
+
+
+def preformatted(page):
+    """Payload as to_dict() used to produce it: dates already isoformat() strings"""
+    jobs = []
+    for job in page['jobs']:
+        job = dict(job)
+        job['created_at'] = job['created_at'].isoformat()
+        job['updated_at'] = job['updated_at'].isoformat()
+        jobs.append(job)
+    return {**page, 'jobs': jobs}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--jobs', type=int, default=100)
+    parser.add_argument('--rounds', type=int, default=2000)
+    args = parser.parse_args()
+    
+    app = Flask(__name__)
+    stdlib_provider = DefaultJSONProvider(app)
+    fast_provider = FastJSONProvider(app)
+    page = build_page(args.jobs)
+    old_page = preformatted(page)
+    
+    with app.app_context():
+        cases = {
+            'before: stdlib provider': lambda: stdlib_provider.response(old_page),
+            'after: FastJSONProvider': lambda: fast_provider.response(page),
+        }
+        assert stdlib_provider.loads(cases['before: stdlib provider']().get_data()) == \
+            fast_provider.loads(cases['after: FastJSONProvider']().get_data()), 'payloads differ'
+        
+        print(f"{args.jobs} jobs/page, {args.rounds} rounds, orjson={'yes' if orjson else 'no'}")
+        results = {}
+        for name, fn in cases.items():
+            best = min(timeit.repeat(fn, number=args.rounds, repeat=5)) / args.rounds
+            results[name] = best
+            print(f"  {name:<40} {best * 1e6:9.1f} us/page")
+    
+    before, after = results.values()
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
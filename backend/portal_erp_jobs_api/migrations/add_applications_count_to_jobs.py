@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Migration script to add applications_count counter column to jobs table
+and backfill it from the applications table.
+Safe to re-run: it also reconciles the counter if it ever drifts.
+"""
+import sqlite3
+import sys
+
+def migrate(db_path):
+    """Add and backfill applications_count on jobs table"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    
+    try:
+        # Check if column already exists
+        cursor.execute("PRAGMA table_info(jobs)")
+        columns = [col[1] for col in cursor.fetchall()]
+        
+        if 'applications_count' not in columns:
+            print("Adding 'applications_count' column to jobs table...")
+            cursor.execute("ALTER TABLE jobs ADD COLUMN applications_count INTEGER NOT NULL DEFAULT 0")
+            print("Column 'applications_count' added successfully!")
+        else:
+            print("Column 'applications_count' already exists. Reconciling values...")
+        
+        # Backfill / reconcile with a single set-based UPDATE
+        cursor.execute("""
+            UPDATE jobs SET applications_count = (
+                SELECT COUNT(*) FROM applications WHERE applications.job_id = jobs.id
+            )
+        """)
+        print(f"Counter updated for {cursor.rowcount} jobs.")
+        
+        # Index so the correlated count above (and per-job lookups) stay cheap
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_applications_job_id ON applications (job_id)")
+        
+        conn.commit()
+            
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        conn.rollback()
+        sys.exit(1)
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    db_path = sys.argv[1] if len(sys.argv) > 1 else "database/app.db"
+    migrate(db_path)
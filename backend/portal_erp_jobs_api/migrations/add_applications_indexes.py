@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the indexes used by the company applications
+listing (GET /api/jobs/<id>/applications):
+- (job_id, applied_at, id): newest-first listing and cursor pagination
+- (job_id, status, applied_at, id): the same with the status filter
+"""
+import sqlite3
+import sys
+
+INDEXES = [
+    ("ix_applications_job_applied", "applications (job_id, applied_at, id)"),
+    ("ix_applications_job_status_applied", "applications (job_id, status, applied_at, id)"),
+]
+
+def migrate(db_path):
+    """Create the applications indexes and show the listing query plans"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    
+    try:
+        for name, definition in INDEXES:
+            print(f"Creating index '{name}' on {definition}...")
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+        cursor.execute("ANALYZE applications")
+        conn.commit()
+        print("Indexes created successfully!")
+        
+        print("\nQuery plans:")
+        for label, filters, params in (
+            ("job", "job_id = ?", (1,)),
+            ("job+status", "job_id = ? AND status = ?", (1, "pending")),
+        ):
+            cursor.execute(
+                f"EXPLAIN QUERY PLAN SELECT id FROM applications WHERE {filters} "
+                "ORDER BY applied_at DESC, id DESC LIMIT 21",
+                params
+            )
+            print(f"  {label}: {' | '.join(row[-1] for row in cursor.fetchall())}")
+            
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        conn.rollback()
+        sys.exit(1)
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    db_path = sys.argv[1] if len(sys.argv) > 1 else "database/app.db"
+    migrate(db_path)
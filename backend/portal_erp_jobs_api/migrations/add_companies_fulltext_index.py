@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Migration script to add a FTS5 full-text index over companies
+(company_name, description).
+
+Same layout as add_jobs_fulltext_index.py: an external-content FTS5 table
+kept in sync by triggers. It backs the q filter of GET /api/companies/search
+(see companies_fulltext in src/services/search.py).
+"""
+import sqlite3
+import sys
+
+STATEMENTS = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS companies_fts USING fts5(
+        company_name, description,
+        content='companies', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS companies_fts_ai AFTER INSERT ON companies BEGIN
+        INSERT INTO companies_fts(rowid, company_name, description)
+        VALUES (new.id, new.company_name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS companies_fts_ad AFTER DELETE ON companies BEGIN
+        INSERT INTO companies_fts(companies_fts, rowid, company_name, description)
+        VALUES ('delete', old.id, old.company_name, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS companies_fts_au AFTER UPDATE OF company_name, description ON companies BEGIN
+        INSERT INTO companies_fts(companies_fts, rowid, company_name, description)
+        VALUES ('delete', old.id, old.company_name, old.description);
+        INSERT INTO companies_fts(rowid, company_name, description)
+        VALUES (new.id, new.company_name, new.description);
+    END
+    """,
+]
+
+def migrate(db_path):
+    """Create companies_fts, its sync triggers and populate it"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    
+    try:
+        print("Creating 'companies_fts' full-text index and triggers...")
+        for statement in STATEMENTS:
+            cursor.execute(statement)
+        
+        # Populate (or repair) the index from the companies table
+        cursor.execute("INSERT INTO companies_fts(companies_fts) VALUES ('rebuild')")
+        conn.commit()
+        
+        cursor.execute("SELECT COUNT(*) FROM companies_fts")
+        print(f"Full-text index ready with {cursor.fetchone()[0]} companies.")
+            
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        conn.rollback()
+        sys.exit(1)
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    db_path = sys.argv[1] if len(sys.argv) > 1 else "database/app.db"
+    migrate(db_path)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Migration script to add precomputed display columns (salary_display,
+location_display) to the jobs table and backfill them.
+
+Job.to_dict() copies these values instead of formatting them on every
+read. New writes keep them in sync through Job._sync_derived_fields.
+"""
+import sqlite3
+import sys
+
+COLUMNS = [
+    ("salary_display", "VARCHAR(60)"),
+    ("location_display", "VARCHAR(110)"),
+]
+
+def format_salary(min_salary, max_salary):
+    """Same formatting as src/models/job.py"""
+    if min_salary and max_salary:
+        return f"R$ {int(min_salary):,} - R$ {int(max_salary):,}".replace(',', '.')
+    elif min_salary:
+        return f"A partir de R$ {int(min_salary):,}".replace(',', '.')
+    return 'A combinar'
+
+def format_location(city, state, work_modality):
+    """Same formatting as src/models/job.py"""
+    if city and state:
+        return f"{city}, {state}"
+    elif city:
+        return city
+    elif work_modality == 'remote':
+        return 'Remoto'
+    return ''
+
+def migrate(db_path):
+    """Add and backfill the display columns"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute("PRAGMA table_info(jobs)")
+        columns = [col[1] for col in cursor.fetchall()]
+        
+        for name, column_type in COLUMNS:
+            if name not in columns:
+                print(f"Adding '{name}' column to jobs table...")
+                cursor.execute(f"ALTER TABLE jobs ADD COLUMN {name} {column_type}")
+            else:
+                print(f"Column '{name}' already exists.")
+        
+        cursor.execute("SELECT id, min_salary, max_salary, city, state, work_modality FROM jobs")
+        rows = [
+            (format_salary(min_salary, max_salary), format_location(city, state, work_modality), job_id)
+            for job_id, min_salary, max_salary, city, state, work_modality in cursor.fetchall()
+        ]
+        cursor.executemany(
+            "UPDATE jobs SET salary_display = ?, location_display = ? WHERE id = ?",
+            rows
+        )
+        conn.commit()
+        print(f"Backfilled display fields for {len(rows)} jobs.")
+            
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        conn.rollback()
+        sys.exit(1)
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    db_path = sys.argv[1] if len(sys.argv) > 1 else "database/app.db"
+    migrate(db_path)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the (is_active, expires_at) index used by the
+expired jobs sweeper (src/services/expiry.py, flask jobs expire) and
+deactivate the jobs that already expired.
+"""
+import sqlite3
+import sys
+from datetime import datetime
+
+def migrate(db_path):
+    """Create ix_jobs_active_expires and deactivate expired jobs"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    
+    try:
+        print("Creating index 'ix_jobs_active_expires' on jobs (is_active, expires_at)...")
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_jobs_active_expires ON jobs (is_active, expires_at)")
+        
+        now = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S.%f')
+        cursor.execute(
+            "UPDATE jobs SET is_active = 0, updated_at = ? WHERE is_active = 1 AND expires_at <= ?",
+            (now, now)
+        )
+        print(f"Deactivated {cursor.rowcount} expired jobs.")
+        conn.commit()
+        
+        cursor.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM jobs WHERE is_active = 1 AND expires_at <= ? "
+            "ORDER BY expires_at LIMIT 500",
+            (now,)
+        )
+        print(f"Sweeper query plan: {' | '.join(row[-1] for row in cursor.fetchall())}")
+            
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        conn.rollback()
+        sys.exit(1)
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    db_path = sys.argv[1] if len(sys.argv) > 1 else "database/app.db"
+    migrate(db_path)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Migration script to add a FTS5 full-text index over jobs
+(title, description, requirements).
+
+The index is an external-content FTS5 table kept in sync by triggers, so
+create_job, update_job and delete_job need no extra code. It backs the
+q and tech filters of GET /api/jobs/ (see src/services/search.py).
+"""
+import sqlite3
+import sys
+
+STATEMENTS = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+        title, description, requirements,
+        content='jobs', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, title, description, requirements)
+        VALUES (new.id, new.title, new.description, new.requirements);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, description, requirements)
+        VALUES ('delete', old.id, old.title, old.description, old.requirements);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE OF title, description, requirements ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, description, requirements)
+        VALUES ('delete', old.id, old.title, old.description, old.requirements);
+        INSERT INTO jobs_fts(rowid, title, description, requirements)
+        VALUES (new.id, new.title, new.description, new.requirements);
+    END
+    """,
+]
+
+def migrate(db_path):
+    """Create jobs_fts, its sync triggers and populate it"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    
+    try:
+        print("Creating 'jobs_fts' full-text index and triggers...")
+        for statement in STATEMENTS:
+            cursor.execute(statement)
+        
+        # Populate (or repair) the index from the jobs table
+        cursor.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+        conn.commit()
+        
+        cursor.execute("SELECT COUNT(*) FROM jobs_fts")
+        print(f"Full-text index ready with {cursor.fetchone()[0]} jobs.")
+            
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        conn.rollback()
+        sys.exit(1)
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    db_path = sys.argv[1] if len(sys.argv) > 1 else "database/app.db"
+    migrate(db_path)
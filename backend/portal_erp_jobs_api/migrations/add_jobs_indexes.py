@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the secondary index set used by the jobs
+listing filters and sort (see __table_args__ in src/models/job.py).
+
+After creating the indexes it runs EXPLAIN QUERY PLAN on the SQL that
+get_all_jobs emits for every filter combination (generated from
+_build_public_jobs_query) and reports any plan that scans the jobs table
+or does not use the index of its selective filter. Use --check to only
+run the verification.
+"""
+import os
+import sqlite3
+import sys
+
+INDEXES = [
+    ("ix_jobs_active_created", "jobs (is_active, created_at, id)"),
+    ("ix_jobs_company_created", "jobs (company_id, created_at, id)"),
+    ("ix_jobs_area_active", "jobs (area_id, is_active, created_at)"),
+    ("ix_jobs_contract_active", "jobs (contract_type, is_active, created_at)"),
+    ("ix_jobs_active_min_salary", "jobs (is_active, min_salary)"),
+    ("ix_jobs_active_max_salary", "jobs (is_active, max_salary)"),
+]
+
+# Filter combinations of GET /api/jobs/ (query string) and the indexes that
+# must serve them: the plan has to use at least one of them. A plan that
+# only walks ix_jobs_active_created for a selective filter reads the whole
+# active set, which is a table scan in practice, so it fails the check.
+FILTER_COMBINATIONS = {
+    "default": ("", ("ix_jobs_active_created",)),
+    "area": ("area=1", ("ix_jobs_area_active",)),
+    "company_id": ("company_id=1", ("ix_jobs_company_created",)),
+    "employment_type": ("employment_type=clt", ("ix_jobs_contract_active",)),
+    "level": ("level=senior", ("ix_jobs_seniority_key_active",)),
+    "work_mode": ("work_mode=remote", ("ix_jobs_work_modality_key_active",)),
+    "city": ("city=Campinas", ("ix_jobs_city_key_active",)),
+    "state": ("state=SP", ("ix_jobs_state_key_active",)),
+    "min_salary": ("min_salary=5000", ("ix_jobs_active_min_salary",)),
+    "max_salary": ("max_salary=15000", ("ix_jobs_active_max_salary",)),
+    "salary_range": ("min_salary=5000&max_salary=15000", ("ix_jobs_active_min_salary", "ix_jobs_active_max_salary")),
+    "q": ("q=python", ("jobs_fts",)),
+    "tech": ("tech=react", ("jobs_fts",)),
+    "area+employment_type": ("area=1&employment_type=clt", ("ix_jobs_area_active", "ix_jobs_contract_active")),
+    "company_id+area": ("company_id=1&area=1", ("ix_jobs_company_created", "ix_jobs_area_active")),
+    "area+min_salary": ("area=1&min_salary=5000", ("ix_jobs_area_active", "ix_jobs_active_min_salary")),
+    "state+level": ("state=SP&level=senior", ("ix_jobs_state_key_active", "ix_jobs_seniority_key_active")),
+    "city+work_mode": ("city=Campinas&work_mode=remote", ("ix_jobs_city_key_active", "ix_jobs_work_modality_key_active")),
+    "q+state": ("q=python&state=SP", ("jobs_fts", "ix_jobs_state_key_active")),
+}
+
+def listing_statements(db_path):
+    """
+    SQL emitted by get_all_jobs for each filter combination, generated from
+    _build_public_jobs_query with the same ORDER BY/LIMIT as paginate_request
+    """
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+    from flask import Flask
+    from src.config import db
+    from src.models.job import Job
+    from src.routes.jobs import _build_public_jobs_query
+    from src.services.pagination import DEFAULT_PER_PAGE
+    
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{os.path.abspath(db_path)}"
+    db.init_app(app)
+    
+    statements = {}
+    for name, (query_string, _) in FILTER_COMBINATIONS.items():
+        with app.test_request_context(f"/api/jobs/?{query_string}"):
+            jobs_query, _ = _build_public_jobs_query()
+            jobs_query = jobs_query.order_by(None).order_by(Job.created_at.desc(), Job.id.desc())
+            statement = jobs_query.limit(DEFAULT_PER_PAGE).statement
+            statements[name] = str(statement.compile(
+                dialect=db.engine.dialect, compile_kwargs={"literal_binds": True}
+            ))
+    return statements
+
+def check_plans(cursor, db_path):
+    """Return the filter combinations whose plan does not use their index"""
+    failures = []
+    for name, sql in listing_statements(db_path).items():
+        expected = FILTER_COMBINATIONS[name][1]
+        cursor.execute("EXPLAIN QUERY PLAN " + sql)
+        details = [row[-1] for row in cursor.fetchall()]
+        scans_table = any(detail in ("SCAN jobs", "SCAN TABLE jobs") for detail in details)
+        uses_index = any(index in detail for detail in details for index in expected)
+        if scans_table:
+            status = "FULL SCAN"
+        elif not uses_index:
+            status = "WRONG INDEX"
+        else:
+            status = "ok"
+        print(f"  [{status}] {name}: {' | '.join(details)}")
+        if status != "ok":
+            failures.append(name)
+    return failures
+
+def migrate(db_path, check_only=False):
+    """Create the jobs indexes and verify the listing query plans"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    
+    try:
+        if not check_only:
+            for name, definition in INDEXES:
+                print(f"Creating index '{name}' on {definition}...")
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+            # Refresh planner statistics
+            cursor.execute("ANALYZE jobs")
+            conn.commit()
+            print("Indexes created successfully!")
+        
+        print("\nChecking GET /api/jobs/ query plans:")
+        failures = check_plans(cursor, db_path)
+        if failures:
+            print(f"\n{len(failures)} filter combination(s) not served by their index: {', '.join(failures)}")
+            sys.exit(1)
+        print("\nEvery filter combination is served by its index.")
+            
+    except sqlite3.Error as e:
+        print(f"Error during migration: {e}")
+        conn.rollback()
+        sys.exit(1)
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--check"]
+    db_path = args[0] if args else "database/app.db"
+    migrate(db_path, check_only="--check" in sys.argv)
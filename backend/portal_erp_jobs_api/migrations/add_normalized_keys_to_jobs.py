@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Migration script to add normalized (lower-cased, accent-free) key columns
+to the jobs table, backfill them and index them.
+
+The level, work_mode, city and state filters of GET /api/jobs/ compare
+these keys by equality instead of running ilike('%value%').
+New writes keep them in sync through Job._sync_derived_fields.
+"""
+import sqlite3
+import sys
+import unicodedata
+
+# Must match WORK_MODALITY_ALIASES in src/models/job.py
+WORK_MODALITY_ALIASES = {
+    'remoto': 'remote',
+    'hibrido': 'hybrid',
+    'presencial': 'onsite',
+}
+
+COLUMNS = [
+    ("seniority_key", "VARCHAR(20)"),
+    ("work_modality_key", "VARCHAR(20)"),
+    ("city_key", "VARCHAR(50)"),
+    ("state_key", "VARCHAR(50)"),
+]
+
+INDEXES = [
+    ("ix_jobs_seniority_key_active", "jobs (seniority_key, is_active, created_at)"),
+    ("ix_jobs_work_modality_key_active", "jobs (work_modality_key, is_active, created_at)"),
+    ("ix_jobs_city_key_active", "jobs (city_key, is_active, created_at)"),
+    ("ix_jobs_state_key_active", "jobs (state_key, is_active, created_at)"),
+]
+
+def normalize_key(value):
+    """Same normalization as src/models/job.py"""
+    if not value:
+        return None
+    value = unicodedata.normalize('NFKD', str(value))
+    value = ''.join(ch for ch in value if not unicodedata.combining(ch))
+    return ' '.join(value.lower().split()) or None
+
+def migrate(db_path):
+    """Add, backfill and index the normalized key columns"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute("PRAGMA table_info(jobs)")
+        columns = [col[1] for col in cursor.fetchall()]
+        
+        for name, column_type in COLUMNS:
+            if name not in columns:
+                print(f"Adding '{name}' column to jobs table...")
+                cursor.execute(f"ALTER TABLE jobs ADD COLUMN {name} {column_type}")
+            else:
+                print(f"Column '{name}' already exists.")
+        
+        # Backfill
+        cursor.execute("SELECT id, seniority_level, work_modality, city, state FROM jobs")
+        rows = []
+        for job_id, seniority_level, work_modality, city, state in cursor.fetchall():
+            work_modality_key = normalize_key(work_modality)
+            rows.append((
+                normalize_key(seniority_level),
+                WORK_MODALITY_ALIASES.get(work_modality_key, work_modality_key),
+                normalize_key(city),
+                normalize_key(state),
+                job_id
+            ))
+        cursor.executemany(
+            "UPDATE jobs SET seniority_key = ?, work_modality_key = ?, city_key = ?, state_key = ? WHERE id = ?",
+            rows
+        )
+        print(f"Backfilled normalized keys for {len(rows)} jobs.")
+        
+        for name, definition in INDEXES:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+        cursor.execute("ANALYZE jobs")
+        conn.commit()
+        print("Indexes created successfully!")
+        
+        # Show the plan for each filter
+        print("\nQuery plans:")
+        for column in ("seniority_key", "work_modality_key", "city_key", "state_key"):
+            cursor.execute(
+                f"EXPLAIN QUERY PLAN SELECT id FROM jobs WHERE is_active = 1 AND {column} = ? "
+                "ORDER BY created_at DESC, id DESC LIMIT 21",
+                ("x",)
+            )
+            print(f"  {column}: {' | '.join(row[-1] for row in cursor.fetchall())}")
+            
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        conn.rollback()
+        sys.exit(1)
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    db_path = sys.argv[1] if len(sys.argv) > 1 else "database/app.db"
+    migrate(db_path)
@@ -1,12 +1,74 @@
 """
 Job model for Portal ERP Jobs
 """
+import unicodedata
 from datetime import datetime
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper, Session, joinedload, selectinload
 from src.config import db
+from src.services.catalogs import skill_catalog, area_catalog
+from src.services.cache import invalidate_after_commit, job_tag, TAG_JOB_LISTS
+
+# Sinônimos aceitos para a modalidade de trabalho
+WORK_MODALITY_ALIASES = {
+    'remoto': 'remote',
+    'hibrido': 'hybrid',
+    'presencial': 'onsite',
+}
+
+
+def normalize_key(value):
+    """Forma normalizada (minúscula, sem acentos) usada nos filtros por igualdade"""
+    if not value:
+        return None
+    value = unicodedata.normalize('NFKD', str(value))
+    value = ''.join(ch for ch in value if not unicodedata.combining(ch))
+    return ' '.join(value.lower().split()) or None
+
+
+def normalize_work_modality(value):
+    key = normalize_key(value)
+    return WORK_MODALITY_ALIASES.get(key, key)
+
+
+def format_salary(min_salary, max_salary):
+    """Texto de exibição da faixa salarial"""
+    if min_salary and max_salary:
+        return f"R$ {int(min_salary):,} - R$ {int(max_salary):,}".replace(',', '.')
+    elif min_salary:
+        return f"A partir de R$ {int(min_salary):,}".replace(',', '.')
+    return 'A combinar'
+
+
+def format_location(city, state, work_modality):
+    """Texto de exibição da localização"""
+    if city and state:
+        return f"{city}, {state}"
+    elif city:
+        return city
+    elif work_modality == 'remote':
+        return 'Remoto'
+    return ''
+
 
 class Job(db.Model):
     """Job posting model"""
     __tablename__ = 'jobs'
+    # Índices dos filtros e da ordenação das listagens
+    # (bases existentes: migrations/add_jobs_indexes.py)
+    __table_args__ = (
+        db.Index('ix_jobs_active_created', 'is_active', 'created_at', 'id'),
+        db.Index('ix_jobs_company_created', 'company_id', 'created_at', 'id'),
+        db.Index('ix_jobs_area_active', 'area_id', 'is_active', 'created_at'),
+        db.Index('ix_jobs_contract_active', 'contract_type', 'is_active', 'created_at'),
+        db.Index('ix_jobs_active_min_salary', 'is_active', 'min_salary'),
+        db.Index('ix_jobs_active_max_salary', 'is_active', 'max_salary'),
+        db.Index('ix_jobs_seniority_key_active', 'seniority_key', 'is_active', 'created_at'),
+        db.Index('ix_jobs_work_modality_key_active', 'work_modality_key', 'is_active', 'created_at'),
+        db.Index('ix_jobs_city_key_active', 'city_key', 'is_active', 'created_at'),
+        db.Index('ix_jobs_state_key_active', 'state_key', 'is_active', 'created_at'),
+        db.Index('ix_jobs_active_expires', 'is_active', 'expires_at'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     company_id = db.Column(db.Integer, db.ForeignKey('companies.id'), nullable=False)
@@ -25,6 +87,14 @@ class Job(db.Model):
     work_modality = db.Column(db.String(20))  # remote, hybrid, onsite
     contract_type = db.Column(db.String(20))  # clt, pj, freelance, internship
     
+    # Chaves normalizadas para filtros por igualdade (preenchidas em _sync_derived_fields)
+    seniority_key = db.Column(db.String(20))
+    work_modality_key = db.Column(db.String(20))
+    
+    # Textos de exibição calculados na escrita (ver _sync_derived_fields)
+    salary_display = db.Column(db.String(60))
+    location_display = db.Column(db.String(110))
+    
     # Salary
     min_salary = db.Column(db.Float)
     max_salary = db.Column(db.Float)
@@ -34,11 +104,16 @@ class Job(db.Model):
     city = db.Column(db.String(50))
     state = db.Column(db.String(50))
     country = db.Column(db.String(50), default='Brasil')
+    city_key = db.Column(db.String(50))
+    state_key = db.Column(db.String(50))
     
     # Status
     is_active = db.Column(db.Boolean, default=True)
     is_company_hidden = db.Column(db.Boolean, default=False)
     
+    # Contadores (mantidos por eventos, ver _register_applications_counter)
+    applications_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    
     # Dates
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -49,6 +124,30 @@ class Job(db.Model):
     applications = db.relationship('Application', backref='job', cascade='all, delete-orphan')
     job_area = db.relationship('JobArea', backref='jobs')
     
+    @staticmethod
+    def list_loader_options():
+        """
+        Opções de carregamento em lote para listagens.
+        Carrega empresa e skills da página inteira em poucas queries,
+        evitando um lazy load por linha em to_dict(). Nomes de skills e
+        dados das áreas vêm dos catálogos em memória.
+        """
+        return (
+            selectinload(Job.company),
+            selectinload(Job.skills),
+        )
+    
+    @staticmethod
+    def detail_loader_options():
+        """
+        Opções de carregamento para o detalhe da vaga: empresa e skills
+        na mesma query (JOIN), nada é carregado depois em to_dict()
+        """
+        return (
+            joinedload(Job.company),
+            joinedload(Job.skills),
+        )
+    
     def to_dict(self, include_details=False):
         """Convert to dictionary"""
         # Buscar nome da empresa
@@ -56,43 +155,31 @@ class Job(db.Model):
         if self.company and not self.is_company_hidden:
             company_name = self.company.company_name
         
-        # Contar candidaturas
-        applications_count = len(self.applications) if self.applications else 0
+        # Contador mantido por _register_applications_counter
+        applications_count = self.applications_count or 0
         
-        # Formatar skills como array de strings
+        # Formatar skills como array de strings (nomes vindos do catálogo em memória)
         skills_array = []
         if self.skills:
-            skills_array = [skill.skill.name for skill in self.skills if skill.skill]
-        
-        # Formatar localização
-        location = ''
-        if self.city and self.state:
-            location = f"{self.city}, {self.state}"
-        elif self.city:
-            location = self.city
-        elif self.work_modality == 'remote':
-            location = 'Remoto'
+            skill_names = (skill_catalog.name(skill.skill_id) for skill in self.skills)
+            skills_array = [name for name in skill_names if name]
         
-        # Formatar salário
-        salary = ''
-        if self.min_salary and self.max_salary:
-            salary = f"R$ {int(self.min_salary):,} - R$ {int(self.max_salary):,}".replace(',', '.')
-        elif self.min_salary:
-            salary = f"A partir de R$ {int(self.min_salary):,}".replace(',', '.')
-        else:
-            salary = 'A combinar'
+        # Localização e salário já formatados na escrita
+        # (formata aqui apenas linhas ainda não migradas)
+        location = self.location_display
+        if location is None:
+            location = format_location(self.city, self.state, self.work_modality)
+        salary = self.salary_display
+        if salary is None:
+            salary = format_salary(self.min_salary, self.max_salary)
         
-        # Obter nome da área (prioriza job_area vinculada, senão usa campo texto legado)
+        # Obter nome da área (prioriza área vinculada, senão usa campo texto legado)
         area_name = None
         area_info = None
-        if self.job_area:
-            area_name = self.job_area.name
-            area_info = {
-                'id': self.job_area.id,
-                'name': self.job_area.name,
-                'icon': self.job_area.icon,
-                'color': self.job_area.color
-            }
+        job_area = area_catalog.get(self.area_id) if self.area_id else None
+        if job_area:
+            area_name = job_area['name']
+            area_info = dict(job_area)
         elif self.area:
             area_name = self.area
         
@@ -117,8 +204,9 @@ class Job(db.Model):
             'location': location,
             'is_active': self.is_active,
             'is_company_hidden': self.is_company_hidden,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            # Datas são serializadas em ISO 8601 pelo JSON provider (src/services/json_provider.py)
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
             'applications_count': applications_count,
             'skills': skills_array
         }
@@ -128,13 +216,25 @@ class Job(db.Model):
             data['requirements'] = self.requirements
             data['responsibilities'] = self.responsibilities
             data['benefits'] = self.benefits
-            data['expires_at'] = self.expires_at.isoformat() if self.expires_at else None
+            data['expires_at'] = self.expires_at
             data['skills_detailed'] = [skill.to_dict() for skill in self.skills]
             data['company'] = self.company.to_dict() if self.company and not self.is_company_hidden else None
         
         return data
 
 
+@event.listens_for(Job, 'before_insert')
+@event.listens_for(Job, 'before_update')
+def _sync_derived_fields(mapper, connection, target):
+    """Manter as chaves normalizadas e os textos de exibição em dia a cada escrita"""
+    target.seniority_key = normalize_key(target.seniority_level)
+    target.work_modality_key = normalize_work_modality(target.work_modality)
+    target.city_key = normalize_key(target.city)
+    target.state_key = normalize_key(target.state)
+    target.salary_display = format_salary(target.min_salary, target.max_salary)
+    target.location_display = format_location(target.city, target.state, target.work_modality)
+
+
 class JobSkill(db.Model):
     """Required skills for jobs"""
     __tablename__ = 'job_skills'
@@ -149,12 +249,68 @@ class JobSkill(db.Model):
         return {
             'id': self.id,
             'skill_id': self.skill_id,
-            'skill_name': self.skill.name if self.skill else None,
+            'skill_name': skill_catalog.name(self.skill_id),
             'is_required': self.is_required,
             'proficiency_level': self.proficiency_level
         }
 
 
+@event.listens_for(JobSkill, 'after_insert')
+@event.listens_for(JobSkill, 'after_update')
+@event.listens_for(JobSkill, 'after_delete')
+def _job_skills_changed(mapper, connection, target):
+    """Skills da vaga mudaram: invalidar o detalhe em cache após o commit"""
+    session = Session.object_session(target)
+    if session is not None and target.job_id:
+        invalidate_after_commit(session, job_tag(target.job_id))
+
+
+# Manutenção do contador Job.applications_count
+# Evita carregar todas as candidaturas de uma vaga só para contá-las. O
+# contador é ajustado no mesmo flush que insere ou remove a candidatura,
+# inclusive na remoção em cascata feita por delete_job. Para reconciliar
+# uma base existente, rode migrations/add_applications_count_to_jobs.py
+
+def _adjust_applications_count(connection, job_id, delta):
+    """Somar delta ao contador da vaga diretamente no banco"""
+    if not job_id:
+        return
+    jobs_table = Job.__table__
+    connection.execute(
+        jobs_table.update()
+        .where(jobs_table.c.id == job_id)
+        .values(applications_count=jobs_table.c.applications_count + delta)
+    )
+
+
+def _invalidate_application_job(target):
+    """applications_count aparece no detalhe e nas listagens: invalidá-los após o commit"""
+    session = Session.object_session(target)
+    if session is not None and target.job_id:
+        invalidate_after_commit(session, job_tag(target.job_id), TAG_JOB_LISTS)
+
+
+def _application_created(mapper, connection, target):
+    _adjust_applications_count(connection, target.job_id, 1)
+    _invalidate_application_job(target)
+
+
+def _application_deleted(mapper, connection, target):
+    _adjust_applications_count(connection, target.job_id, -1)
+    _invalidate_application_job(target)
+
+
+@event.listens_for(Mapper, 'mapper_configured')
+def _register_applications_counter(mapper, class_):
+    """
+    Registrar os eventos do contador quando o mapper de Application é
+    configurado, o que acontece antes de qualquer uso do model: o contador
+    não depende de qual módulo importou Application
+    """
+    if mapper.local_table is not None and mapper.local_table.name == 'applications':
+        event.listen(class_, 'after_insert', _application_created)
+        event.listen(class_, 'after_delete', _application_deleted)
+
 class Skill(db.Model):
     """Skills/Technologies catalog"""
     __tablename__ = 'skills'
@@ -173,3 +329,4 @@ class Skill(db.Model):
             'name': self.name,
             'category': self.category
         }
+
@@ -3,8 +3,16 @@ from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from src.models.company import Company
 from src.models.user import User
 from src.config import db
+from src.services.json_provider import install_json_provider
+from src.services.cache import invalidate_company
+from src.services.company_context import get_current_company, remember_company
+from src.services.counters import platform_counters, TOTAL_COMPANIES
+from src.services.search import companies_fulltext
+from src.services.pagination import paginate_request, InvalidCursor
+from src.services.prefix_index import company_name_index
 
 companies_bp = Blueprint('companies', __name__, url_prefix='/api/companies')
+companies_bp.record_once(lambda state: install_json_provider(state.app))
 
 @companies_bp.route('/me', methods=['GET'])
 @companies_bp.route('/profile', methods=['GET'])
@@ -14,15 +22,14 @@ def get_my_company_profile():
     Obter perfil completo da empresa autenticada
     """
     try:
-        current_user_id = get_jwt_identity()
         claims = get_jwt()
         
         # Verificar se é empresa
         if claims.get('user_type') != 'company':
             return jsonify({'error': 'Acesso negado. Apenas empresas podem acessar'}), 403
         
-        # Buscar empresa
-        company = Company.query.filter_by(user_id=current_user_id).first()
+        # Buscar empresa (id resolvido uma vez por requisição, com cache)
+        company = get_current_company()
         
         if not company:
             return jsonify({'error': 'Perfil de empresa não encontrado'}), 404
@@ -51,7 +58,7 @@ def create_or_update_company_profile():
         data = request.get_json()
         
         # Buscar empresa existente
-        company = Company.query.filter_by(user_id=current_user_id).first()
+        company = get_current_company()
         
         if company:
             # Atualizar
@@ -75,6 +82,7 @@ def create_or_update_company_profile():
                 company.industry = data['industry']
             
             db.session.commit()
+            invalidate_company(company.id)
             
             return jsonify({
                 'message': 'Perfil atualizado com sucesso',
@@ -97,6 +105,8 @@ def create_or_update_company_profile():
             
             db.session.add(new_company)
             db.session.commit()
+            remember_company(current_user_id, new_company.id)
+            platform_counters.adjust(TOTAL_COMPANIES, 1)
             
             return jsonify({
                 'message': 'Perfil criado com sucesso',
@@ -137,20 +147,13 @@ def search_companies():
         state = request.args.get('state', '')
         size = request.args.get('size', '')
         industry = request.args.get('industry', '')
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 20, type=int)
         
         # Construir query
         companies_query = Company.query
         
-        # Filtro de texto (nome ou descrição)
+        # Filtro de texto (nome ou descrição), servido pelo índice full-text
         if query:
-            companies_query = companies_query.filter(
-                db.or_(
-                    Company.company_name.ilike(f'%{query}%'),
-                    Company.description.ilike(f'%{query}%')
-                )
-            )
+            companies_query = companies_query.filter(companies_fulltext.filter(query))
         
         # Filtro de localização
         if city:
@@ -166,17 +169,34 @@ def search_companies():
         if industry:
             companies_query = companies_query.filter(Company.industry.ilike(f'%{industry}%'))
         
-        # Paginação
-        pagination = companies_query.paginate(page=page, per_page=per_page, error_out=False)
+        # Paginação (page/per_page ou cursor), per_page limitado
+        companies, page_info = paginate_request(companies_query, Company.created_at, Company.id)
         
         return jsonify({
-            'companies': [c.to_dict() for c in pagination.items],
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'current_page': page,
-            'per_page': per_page
+            'companies': [c.to_dict() for c in companies],
+            **page_info
         }), 200
         
+    except InvalidCursor:
+        return jsonify({'error': 'Cursor de paginação inválido'}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+
+@companies_bp.route('/autocomplete', methods=['GET'])
+def autocomplete_companies():
+    """
+    Sugestões de empresas por prefixo do nome (público)
+    Servido pelo índice de prefixos em memória, sem query por tecla
+    """
+    try:
+        prefix = request.args.get('prefix', '')
+        limit = request.args.get('limit', 10, type=int) or 10
+        
+        return jsonify({
+            'companies': company_name_index.search(prefix, limit),
+            'prefix': prefix
+        }), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -1,14 +1,155 @@
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
-from src.models.job import Job, JobSkill, Skill
+from flask import Blueprint, request, jsonify, current_app
+from flask_jwt_extended import jwt_required, get_jwt
+from src.models.job import Job, JobSkill, normalize_key, normalize_work_modality
 from src.models.company import Company
+from src.services.company_context import get_current_company_id
 from src.models.application import Application
-from src.models.job_area import JobArea
+from src.services.search import jobs_fulltext
+from src.services.pagination import paginate_request, InvalidCursor
+from src.services.cache import (
+    response_cache, request_cache_key, invalidate_jobs,
+    TAG_JOB_LISTS, job_tag, company_tag
+)
+from src.services.counters import platform_counters, ACTIVE_JOBS
+from src.services.catalogs import skill_catalog, area_catalog
+from src.services.prefix_index import job_suggest_index
+from src.services.expiry import sweep_with_lock, start_expiry_sweeper
 from src.config import db
-from sqlalchemy import or_, and_
+from src.services.json_provider import install_json_provider
+from src.services.http_cache import (
+    compute_etag, last_modified_timestamp, is_not_modified,
+    not_modified_response, conditional_json
+)
+from src.services.export import stream_records, chunked, EXPORT_CHUNK_SIZE, EXPORT_FORMATS
+from sqlalchemy import and_, or_, delete, func, insert, literal, update, inspect as sa_inspect
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import MANYTOONE
 from datetime import datetime
+from itertools import islice
+import json
 
 jobs_bp = Blueprint('jobs', __name__, url_prefix='/api/jobs')
+jobs_bp.record_once(lambda state: install_json_provider(state.app))
+# Índice de sugestões construído já no registro (a primeira busca não volta vazia)
+jobs_bp.record_once(lambda state: job_suggest_index.refresh_async(state.app))
+# Desativação periódica de vagas vencidas (ligada por EXPIRY_SWEEP_INTERVAL)
+jobs_bp.record_once(lambda state: start_expiry_sweeper(state.app))
+
+# Facetas de GET /api/jobs/facets: nome -> (coluna agrupada, coluna do rótulo)
+# (chaves normalizadas, que podem ser usadas diretamente como filtro; o
+# rótulo é a grafia original, min() por chave. Área usa o catálogo)
+FACET_COLUMNS = {
+    'area': (Job.area_id, None),
+    'level': (Job.seniority_key, Job.seniority_level),
+    'work_mode': (Job.work_modality_key, Job.work_modality),
+    'employment_type': (Job.contract_type, Job.contract_type),
+    'state': (Job.state_key, Job.state),
+}
+
+
+def _build_public_jobs_query():
+    """
+    Query de vagas ativas com os filtros públicos da requisição
+    Compartilhada por GET /api/jobs/ e GET /api/jobs/facets.
+    Retorna (query, filtros aplicados)
+    """
+    # Parâmetros de busca
+    query = request.args.get('q', '')
+    city = request.args.get('city', '')
+    state = request.args.get('state', '')
+    employment_type = request.args.get('employment_type', '')
+    work_mode = request.args.get('work_mode', '')
+    min_salary = request.args.get('min_salary', type=int)
+    max_salary = request.args.get('max_salary', type=int)
+    
+    # Novos filtros avançados
+    technology = request.args.get('tech', '')  # Filtro por tecnologia específica
+    area = request.args.get('area', '')  # Filtro por área de atuação
+    level = request.args.get('level', '')  # Filtro por nível de experiência
+    company_id = request.args.get('company_id', type=int)  # Filtro por empresa
+    salary_exact_min = request.args.get('salary_min_exact', type=int)  # Salário mínimo exato
+    salary_exact_max = request.args.get('salary_max_exact', type=int)  # Salário máximo exato
+    
+    # Construir query - apenas vagas ativas
+    jobs_query = Job.query.filter_by(is_active=True)
+    
+    # Filtro de texto (título, descrição ou requisitos) via índice full-text
+    if query:
+        jobs_query = jobs_query.filter(jobs_fulltext.filter(query))
+    
+    # Filtro por tecnologia específica (busca no título, descrição e requisitos)
+    if technology:
+        jobs_query = jobs_query.filter(jobs_fulltext.filter(technology))
+    
+    # Filtro por área de atuação (suporta area_id ou texto)
+    if area:
+        # Tentar converter para int (area_id)
+        try:
+            area_id = int(area)
+            jobs_query = jobs_query.filter(Job.area_id == area_id)
+        except ValueError:
+            # Se não for int, mapear o texto para area_ids em memória; vagas legadas
+            # sem area_id continuam casando pelo texto (compatibilidade)
+            jobs_query = jobs_query.filter(or_(
+                Job.area_id.in_(area_catalog.ids_matching(area)),
+                and_(Job.area_id.is_(None), Job.area.ilike(f'%{area}%'))
+            ))
+    
+    # Filtro por nível de experiência
+    if level:
+        jobs_query = jobs_query.filter(Job.seniority_key == normalize_key(level))
+    
+    # Filtro por empresa
+    if company_id:
+        jobs_query = jobs_query.filter(Job.company_id == company_id)
+    
+    # Filtro de localização
+    if city:
+        jobs_query = jobs_query.filter(Job.city_key == normalize_key(city))
+    if state:
+        jobs_query = jobs_query.filter(Job.state_key == normalize_key(state))
+    
+    # Filtro de tipo de contratação
+    if employment_type:
+        jobs_query = jobs_query.filter(Job.contract_type == employment_type)
+    
+    # Filtro de modo de trabalho
+    if work_mode:
+        jobs_query = jobs_query.filter(Job.work_modality_key == normalize_work_modality(work_mode))
+    
+    # Filtro de salário (faixa)
+    if min_salary:
+        jobs_query = jobs_query.filter(Job.min_salary >= min_salary)
+    if max_salary:
+        jobs_query = jobs_query.filter(Job.max_salary <= max_salary)
+    
+    # Filtro de salário exato (para busca precisa)
+    if salary_exact_min and salary_exact_max:
+        # Busca vagas que tenham salário dentro da faixa especificada
+        jobs_query = jobs_query.filter(
+            and_(
+                Job.min_salary >= salary_exact_min,
+                Job.max_salary <= salary_exact_max
+            )
+        )
+    elif salary_exact_min:
+        jobs_query = jobs_query.filter(Job.min_salary >= salary_exact_min)
+    elif salary_exact_max:
+        jobs_query = jobs_query.filter(Job.max_salary <= salary_exact_max)
+    
+    filters_applied = {
+        'query': query,
+        'technology': technology,
+        'area': area,
+        'level': level,
+        'city': city,
+        'state': state,
+        'work_mode': work_mode,
+        'min_salary': min_salary or salary_exact_min,
+        'max_salary': max_salary or salary_exact_max
+    }
+    return jobs_query, filters_applied
+
 
 @jobs_bp.route('/', methods=['GET'])
 def get_all_jobs():
@@ -17,128 +158,121 @@ def get_all_jobs():
     Suporta filtros avançados por tecnologia, área e faixa salarial exata
     """
     try:
-        # Parâmetros de busca
-        query = request.args.get('q', '')
-        city = request.args.get('city', '')
-        state = request.args.get('state', '')
-        employment_type = request.args.get('employment_type', '')
-        work_mode = request.args.get('work_mode', '')
-        min_salary = request.args.get('min_salary', type=int)
-        max_salary = request.args.get('max_salary', type=int)
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 20, type=int)
-        
-        # Novos filtros avançados
-        technology = request.args.get('tech', '')  # Filtro por tecnologia específica
-        area = request.args.get('area', '')  # Filtro por área de atuação
-        level = request.args.get('level', '')  # Filtro por nível de experiência
-        company_id = request.args.get('company_id', type=int)  # Filtro por empresa
-        salary_exact_min = request.args.get('salary_min_exact', type=int)  # Salário mínimo exato
-        salary_exact_max = request.args.get('salary_max_exact', type=int)  # Salário máximo exato
-        
-        # Construir query - apenas vagas ativas
-        jobs_query = Job.query.filter_by(is_active=True)
-        
-        # Filtro de texto (título ou descrição)
-        if query:
-            jobs_query = jobs_query.filter(
-                or_(
-                    Job.title.ilike(f'%{query}%'),
-                    Job.description.ilike(f'%{query}%'),
-                    Job.requirements.ilike(f'%{query}%')
-                )
+        # Resposta em cache para o mesmo conjunto de filtros e página
+        cache_key = request_cache_key('jobs:list')
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return conditional_json(cached['payload'], cached['etag'])
+        
+        jobs_query, filters_applied = _build_public_jobs_query()
+        
+        # Carregar relacionamentos da página inteira em lote
+        jobs_query = jobs_query.options(*Job.list_loader_options())
+        
+        # Paginação (page/per_page ou cursor), mais recentes primeiro
+        jobs, page_info = paginate_request(jobs_query, Job.created_at, Job.id)
+        
+        # ETag da página já carregada (sem agregados sobre todo o conjunto filtrado).
+        # Sem Last-Modified: max(updated_at) não muda quando uma vaga é excluída
+        etag = compute_etag(
+            'jobs', cache_key, skill_catalog.version, area_catalog.version,
+            *sorted(page_info.items()),
+            *(
+                (job.id, job.updated_at, job.applications_count,
+                 job.company.updated_at if job.company else None)
+                for job in jobs
             )
+        )
+        if is_not_modified(etag):
+            return not_modified_response(etag)
         
-        # Filtro por tecnologia específica (busca no título, descrição e requisitos)
-        if technology:
-            jobs_query = jobs_query.filter(
-                or_(
-                    Job.title.ilike(f'%{technology}%'),
-                    Job.description.ilike(f'%{technology}%'),
-                    Job.requirements.ilike(f'%{technology}%')
-                )
-            )
+        payload = {
+            'jobs': [job.to_dict() for job in jobs],
+            **page_info,
+            'filters_applied': filters_applied
+        }
         
-        # Filtro por área de atuação (suporta area_id ou texto)
-        if area:
-            # Tentar converter para int (area_id)
-            try:
-                area_id = int(area)
-                jobs_query = jobs_query.filter(Job.area_id == area_id)
-            except ValueError:
-                # Se não for int, buscar por texto (compatibilidade)
-                jobs_query = jobs_query.filter(
-                    or_(
-                        Job.area.ilike(f'%{area}%'),
-                        Job.job_area.has(JobArea.name.ilike(f'%{area}%'))
-                    )
-                )
+        tags = {TAG_JOB_LISTS} | {company_tag(j.company_id) for j in jobs}
+        response_cache.set(cache_key, {'payload': payload, 'etag': etag}, tags=tags)
         
-        # Filtro por nível de experiência
-        if level:
-            jobs_query = jobs_query.filter(Job.seniority_level.ilike(f'%{level}%'))
-        
-        # Filtro por empresa
-        if company_id:
-            jobs_query = jobs_query.filter(Job.company_id == company_id)
-        
-        # Filtro de localização
-        if city:
-            jobs_query = jobs_query.filter(Job.city.ilike(f'%{city}%'))
-        if state:
-            jobs_query = jobs_query.filter(Job.state.ilike(f'%{state}%'))
-        
-        # Filtro de tipo de contratação
-        if employment_type:
-            jobs_query = jobs_query.filter(Job.contract_type == employment_type)
-        
-        # Filtro de modo de trabalho
-        if work_mode:
-            jobs_query = jobs_query.filter(Job.work_modality.ilike(f'%{work_mode}%'))
-        
-        # Filtro de salário (faixa)
-        if min_salary:
-            jobs_query = jobs_query.filter(Job.min_salary >= min_salary)
-        if max_salary:
-            jobs_query = jobs_query.filter(Job.max_salary <= max_salary)
-        
-        # Filtro de salário exato (para busca precisa)
-        if salary_exact_min and salary_exact_max:
-            # Busca vagas que tenham salário dentro da faixa especificada
-            jobs_query = jobs_query.filter(
-                and_(
-                    Job.min_salary >= salary_exact_min,
-                    Job.max_salary <= salary_exact_max
-                )
+        return conditional_json(payload, etag)
+        
+    except InvalidCursor:
+        return jsonify({'error': 'Cursor de paginação inválido'}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@jobs_bp.route('/facets', methods=['GET'])
+def get_job_facets():
+    """
+    Contagens por faceta para a barra lateral de busca (público)
+    Aceita os mesmos filtros de GET /api/jobs/; cada faceta é uma query
+    agrupada, e o banco devolve só as contagens
+    """
+    try:
+        cache_key = request_cache_key('jobs:facets')
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return jsonify(cached), 200
+        
+        jobs_query, filters_applied = _build_public_jobs_query()
+        
+        base_query = jobs_query.order_by(None)
+        total = base_query.with_entities(func.count(Job.id)).scalar()
+        
+        facets = {}
+        for name, (key_column, label_column) in FACET_COLUMNS.items():
+            present = [key_column.isnot(None)]
+            if label_column is None:
+                label = literal(None)
+            else:
+                # Colunas texto: vazio conta como ausente
+                label = func.min(label_column)
+                present.append(key_column != '')
+            count = func.count(Job.id)
+            rows = (
+                base_query
+                .filter(*present)
+                .with_entities(key_column, label, count)
+                .group_by(key_column)
+                .order_by(count.desc(), key_column)
             )
-        elif salary_exact_min:
-            jobs_query = jobs_query.filter(Job.min_salary >= salary_exact_min)
-        elif salary_exact_max:
-            jobs_query = jobs_query.filter(Job.max_salary <= salary_exact_max)
+            facets[name] = [{'value': value, 'label': label, 'count': count} for value, label, count in rows]
         
-        # Ordenar por data de criação (mais recentes primeiro)
-        jobs_query = jobs_query.order_by(Job.created_at.desc())
+        # Nome da área a partir do catálogo em memória
+        for item in facets['area']:
+            area = area_catalog.get(item['value'])
+            item['label'] = area['name'] if area else None
         
-        # Paginação
-        pagination = jobs_query.paginate(page=page, per_page=per_page, error_out=False)
+        payload = {
+            'total': total,
+            'facets': facets,
+            'filters_applied': filters_applied
+        }
+        response_cache.set(cache_key, payload, tags=(TAG_JOB_LISTS,))
+        
+        return jsonify(payload), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@jobs_bp.route('/suggest', methods=['GET'])
+def suggest_jobs():
+    """
+    Sugestões para a busca de vagas: títulos, skills, cidades e estados
+    das vagas ativas, por prefixo, ordenados pelo número de vagas ativas.
+    Servido pelo índice em memória (reconstruído em segundo plano após
+    alterações nas vagas), sem consultar o banco.
+    """
+    try:
+        prefix = request.args.get('prefix', '')
+        limit = request.args.get('limit', 10, type=int) or 10
         
         return jsonify({
-            'jobs': [j.to_dict() for j in pagination.items],
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'current_page': page,
-            'per_page': per_page,
-            'filters_applied': {
-                'query': query,
-                'technology': technology,
-                'area': area,
-                'level': level,
-                'city': city,
-                'state': state,
-                'work_mode': work_mode,
-                'min_salary': min_salary or salary_exact_min,
-                'max_salary': max_salary or salary_exact_max
-            }
+            'suggestions': job_suggest_index.search(prefix, limit),
+            'prefix': prefix
         }), 200
         
     except Exception as e:
@@ -151,17 +285,112 @@ def get_job_by_id(job_id):
     Obter detalhes de uma vaga específica
     """
     try:
-        job = Job.query.get(job_id)
+        # Versões dos catálogos na chave: renomear skill/área gera outra entrada
+        catalog_versions = f'{skill_catalog.version}.{area_catalog.version}'
+        cache_key = f'jobs:detail:{job_id}:{catalog_versions}'
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return conditional_json(cached['payload'], cached['etag'], cached['last_modified'])
+        
+        # Validadores a partir das datas de atualização (sem carregar relacionamentos)
+        versions = db.session.query(
+            Job.updated_at, Job.applications_count, Company.updated_at
+        ).join(Company, Company.id == Job.company_id).filter(Job.id == job_id).first()
+        
+        if not versions:
+            return jsonify({'error': 'Vaga não encontrada'}), 404
         
+        job_updated_at, applications_count, company_updated_at = versions
+        etag = compute_etag('job', job_id, job_updated_at, company_updated_at, applications_count, catalog_versions)
+        last_modified = last_modified_timestamp(job_updated_at, company_updated_at)
+        if is_not_modified(etag, last_modified):
+            return not_modified_response(etag, last_modified)
+        
+        # Vaga, empresa e skills em uma única query
+        job = Job.query.options(*Job.detail_loader_options()).filter(Job.id == job_id).first()
         if not job:
             return jsonify({'error': 'Vaga não encontrada'}), 404
         
-        return jsonify(job.to_dict(include_details=True)), 200
+        payload = job.to_dict(include_details=True)
+        response_cache.set(
+            cache_key,
+            {'payload': payload, 'etag': etag, 'last_modified': last_modified},
+            tags=(job_tag(job.id), company_tag(job.company_id))
+        )
+        
+        return conditional_json(payload, etag, last_modified)
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def _parse_area_id(value):
+    """area_id do payload como int (aceita texto numérico, como o antigo JobArea.query.get)"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, bool):
+        raise ValueError('area_id deve ser um número inteiro')
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError('area_id deve ser um número inteiro')
+
+
+def _job_fields_from_payload(data):
+    """
+    Campos de uma nova vaga a partir do payload de criação
+    Aceita os nomes alternativos usados pelo frontend e pelas integrações
+    """
+    return {
+        'title': data.get('title'),
+        'description': data.get('description'),
+        'requirements': data.get('requirements'),
+        'responsibilities': data.get('responsibilities'),
+        # Sem area_id, tentar mapear o texto legado para uma área do catálogo
+        'area_id': _parse_area_id(data.get('area_id')) or area_catalog.resolve(data.get('area')),
+        'area': data.get('area'),  # Mantido para compatibilidade
+        # Aceitar tanto level quanto seniority_level
+        'seniority_level': data.get('seniority_level') or data.get('level'),
+        # Aceitar tanto work_mode quanto work_modality (compatibilidade frontend)
+        'work_modality': data.get('work_modality') or data.get('work_mode', 'hybrid'),
+        'contract_type': data.get('contract_type', 'clt'),
+        # Aceitar tanto salary_min/max quanto min_salary/max_salary
+        'min_salary': data.get('min_salary') or data.get('salary_min'),
+        'max_salary': data.get('max_salary') or data.get('salary_max'),
+        'city': data.get('city'),
+        'state': data.get('state'),
+        'country': data.get('country', 'Brasil'),
+    }
+
+
+def _skill_items_from_payload(data):
+    """
+    Lista de (skill_id, is_required) a partir de skills/technologies, sem repetição
+    Cada item pode ser um ID (número ou texto numérico) ou um objeto com skill_id/id
+    """
+    items = []
+    seen = set()
+    skills_data = data.get('skills', []) or data.get('technologies', [])
+    for skill_item in skills_data or []:
+        if isinstance(skill_item, dict):
+            skill_id = skill_item.get('skill_id') or skill_item.get('id')
+            is_required = bool(skill_item.get('is_required', False))
+        else:
+            skill_id = skill_item
+            is_required = False
+        # bool é subclasse de int: True não é a skill 1
+        if isinstance(skill_id, bool):
+            continue
+        try:
+            skill_id = int(skill_id)
+        except (TypeError, ValueError):
+            continue
+        if skill_id and skill_id not in seen:
+            seen.add(skill_id)
+            items.append((skill_id, is_required))
+    return items
+
+
 @jobs_bp.route('/', methods=['POST'])
 @jwt_required()
 def create_job():
@@ -169,16 +398,15 @@ def create_job():
     Criar nova vaga (apenas empresas)
     """
     try:
-        current_user_id = get_jwt_identity()
         claims = get_jwt()
         
         # Verificar se é empresa
         if claims.get('user_type') != 'company':
             return jsonify({'error': 'Acesso negado. Apenas empresas podem criar vagas'}), 403
         
-        # Buscar empresa
-        company = Company.query.filter_by(user_id=current_user_id).first()
-        if not company:
+        # Empresa do usuário (resolvida uma vez por requisição, com cache)
+        company_id = get_current_company_id()
+        if not company_id:
             return jsonify({'error': 'Perfil de empresa não encontrado. Crie um perfil primeiro'}), 404
         
         data = request.get_json()
@@ -189,66 +417,36 @@ def create_job():
             print("[ERROR] Missing title or description")
             return jsonify({'error': 'Título e descrição são obrigatórios'}), 400
         
-        # Criar nova vaga
-        # Aceitar tanto work_mode quanto work_modality (compatibilidade frontend)
-        work_modality = data.get('work_modality') or data.get('work_mode', 'hybrid')
-        # Aceitar tanto salary_min/max quanto min_salary/max_salary
-        min_salary = data.get('min_salary') or data.get('salary_min')
-        max_salary = data.get('max_salary') or data.get('salary_max')
-        # Aceitar tanto level quanto seniority_level
-        seniority_level = data.get('seniority_level') or data.get('level')
-        
         # Processar area_id
-        area_id = data.get('area_id')
-        area_text = data.get('area')
+        fields = _job_fields_from_payload(data)
+        area_id = fields['area_id']
         
         # Se area_id for fornecido, validar
-        if area_id:
-            job_area = JobArea.query.get(area_id)
-            if not job_area:
-                return jsonify({'error': f'Área com ID {area_id} não encontrada'}), 400
+        if area_id and not area_catalog.get(area_id):
+            return jsonify({'error': f'Área com ID {area_id} não encontrada'}), 400
         
-        new_job = Job(
-            company_id=company.id,
-            title=data.get('title'),
-            description=data.get('description'),
-            requirements=data.get('requirements'),
-            responsibilities=data.get('responsibilities'),
-            area_id=area_id,
-            area=area_text,  # Mantido para compatibilidade
-            seniority_level=seniority_level,
-            work_modality=work_modality,
-            contract_type=data.get('contract_type', 'clt'),
-            min_salary=min_salary,
-            max_salary=max_salary,
-            city=data.get('city'),
-            state=data.get('state'),
-            country=data.get('country', 'Brasil'),
-            is_active=True
-        )
+        # Criar nova vaga
+        new_job = Job(company_id=company_id, is_active=True, **fields)
         
         print(f"[DEBUG] Creating job with data: title={data.get('title')}, work_mode={data.get('work_mode')}, contract_type={data.get('contract_type')}, area_id={area_id}")
         db.session.add(new_job)
         db.session.flush()  # Para obter o ID da vaga
         
-        # Processar skills/technologies
-        skills_data = data.get('skills', []) or data.get('technologies', [])
-        if skills_data:
-            for skill_item in skills_data:
-                # skill_item pode ser um ID ou um objeto com skill_id
-                skill_id = skill_item if isinstance(skill_item, int) else skill_item.get('skill_id') or skill_item.get('id')
-                if skill_id:
-                    # Verificar se skill existe
-                    skill = Skill.query.get(skill_id)
-                    if skill:
-                        job_skill = JobSkill(
-                            job_id=new_job.id,
-                            skill_id=skill_id,
-                            is_required=skill_item.get('is_required', False) if isinstance(skill_item, dict) else False
-                        )
-                        db.session.add(job_skill)
+        # Processar skills/technologies (validadas contra o catálogo em memória)
+        skill_items = _skill_items_from_payload(data)
+        valid_skill_ids = skill_catalog.existing_ids(skill_id for skill_id, _ in skill_items)
+        for skill_id, is_required in skill_items:
+            if skill_id in valid_skill_ids:
+                job_skill = JobSkill(
+                    job_id=new_job.id,
+                    skill_id=skill_id,
+                    is_required=is_required
+                )
+                db.session.add(job_skill)
         
         db.session.commit()
+        invalidate_jobs()
+        platform_counters.adjust(ACTIVE_JOBS, 1)
         print("[DEBUG] Job created successfully!")
         
         return jsonify({
@@ -256,6 +454,9 @@ def create_job():
             'job': new_job.to_dict()
         }), 201
         
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         db.session.rollback()
         print(f"[ERROR] Failed to create job: {str(e)}")
@@ -265,6 +466,384 @@ def create_job():
         return jsonify({'error': str(e)}), 500
 
 
+BULK_CHUNK_SIZE = 500
+NDJSON_MIMETYPES = ('application/x-ndjson', 'application/jsonl', 'application/x-jsonlines')
+
+
+def _iter_bulk_items():
+    """
+    Itens do corpo de POST /api/jobs/bulk como (índice, item, erro)
+    Aceita um array JSON, {"jobs": [...]} ou NDJSON (uma vaga por linha, lido em streaming)
+    """
+    if request.mimetype in NDJSON_MIMETYPES:
+        index = 0
+        for line in request.stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield index, json.loads(line), None
+            except ValueError as e:
+                yield index, None, f'JSON inválido: {e}'
+            index += 1
+        return
+    
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        data = data.get('jobs')
+    if not isinstance(data, list):
+        raise ValueError('Envie um array de vagas, {"jobs": [...]} ou NDJSON')
+    for index, item in enumerate(data):
+        yield index, item, None
+
+
+def _bulk_fields_error(fields):
+    """
+    Validar tipos e tamanhos dos campos de uma vaga do lote antes do INSERT
+    (salários numéricos, textos dentro do limite das colunas). Normaliza os
+    salários em fields e retorna a mensagem de erro, ou None
+    """
+    for name in ('min_salary', 'max_salary'):
+        value = fields[name]
+        if value is None or value == '':
+            fields[name] = None
+            continue
+        if isinstance(value, bool):
+            return f'{name} deve ser numérico'
+        try:
+            fields[name] = float(value)
+        except (TypeError, ValueError):
+            return f'{name} deve ser numérico'
+    
+    for name, value in fields.items():
+        if value is None or name in ('min_salary', 'max_salary', 'area_id'):
+            continue
+        length = getattr(Job.__table__.columns[name].type, 'length', None)
+        if not isinstance(value, str):
+            return f'{name} deve ser texto'
+        if length and len(value) > length:
+            return f'{name} excede {length} caracteres'
+    return None
+
+
+def _add_bulk_jobs(company_id, entries, valid_skill_ids):
+    """INSERT das vagas e de seus JobSkill na transação atual; retorna (índice, job_id)"""
+    jobs = [(index, Job(company_id=company_id, is_active=True, **fields), skills) for index, fields, skills in entries]
+    db.session.add_all([job for _, job, _ in jobs])
+    db.session.flush()  # INSERT em lote, obtém os IDs
+    
+    skill_rows = []
+    for _, job, skills in jobs:
+        for skill_id, is_required in skills:
+            if skill_id in valid_skill_ids:
+                skill_rows.append({'job_id': job.id, 'skill_id': skill_id, 'is_required': is_required})
+    if skill_rows:
+        db.session.execute(insert(JobSkill), skill_rows)
+    
+    # IDs lidos antes do commit (que expira os objetos)
+    return [(index, job.id) for index, job, _ in jobs]
+
+
+def _insert_bulk_chunk(company_id, chunk, errors):
+    """
+    Validar e inserir um lote de vagas em uma única transação
+    Áreas e skills são validadas pelos catálogos em memória;
+    vagas e JobSkill são inseridas em lote. Se o lote falhar no banco, as
+    vagas são refeitas uma a uma (um SAVEPOINT cada), e só a que falhou é
+    reportada. Retorna a lista de (índice, job_id) criados.
+    """
+    candidates = []
+    for index, item, error in chunk:
+        if error:
+            errors.append({'index': index, 'error': error})
+        elif not isinstance(item, dict):
+            errors.append({'index': index, 'error': 'Cada vaga deve ser um objeto JSON'})
+        elif not item.get('title') or not item.get('description'):
+            errors.append({'index': index, 'error': 'Título e descrição são obrigatórios'})
+        else:
+            try:
+                fields = _job_fields_from_payload(item)
+            except ValueError as e:
+                errors.append({'index': index, 'error': str(e)})
+                continue
+            candidates.append((index, fields, _skill_items_from_payload(item)))
+    
+    if not candidates:
+        return []
+    
+    # Validação set-based de skills (áreas vêm do catálogo em memória)
+    valid_skill_ids = skill_catalog.existing_ids(
+        {skill_id for _, _, skills in candidates for skill_id, _ in skills}
+    )
+    
+    to_insert = []
+    for index, fields, skills in candidates:
+        field_error = _bulk_fields_error(fields)
+        if field_error:
+            errors.append({'index': index, 'error': field_error})
+            continue
+        if fields['area_id'] and not area_catalog.get(fields['area_id']):
+            errors.append({'index': index, 'error': f"Área com ID {fields['area_id']} não encontrada"})
+            continue
+        to_insert.append((index, fields, skills))
+    
+    if not to_insert:
+        return []
+    
+    try:
+        created = _add_bulk_jobs(company_id, to_insert, valid_skill_ids)
+        db.session.commit()
+        return created
+    except Exception:
+        db.session.rollback()
+    
+    # Alguma vaga quebrou o lote: refazer item a item
+    created = []
+    for entry in to_insert:
+        try:
+            with db.session.begin_nested():
+                created.extend(_add_bulk_jobs(company_id, [entry], valid_skill_ids))
+        except Exception as e:
+            errors.append({'index': entry[0], 'error': str(e)})
+    try:
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        errors.extend({'index': index, 'error': str(e)} for index, _ in created)
+        return []
+    
+    return created
+
+
+@jobs_bp.route('/bulk', methods=['POST'])
+@jwt_required()
+def bulk_create_jobs():
+    """
+    Criar vagas em lote (integrações ERP)
+    Processa em transações de BULK_CHUNK_SIZE vagas; erros são reportados
+    por item sem abortar o restante do lote
+    """
+    try:
+        claims = get_jwt()
+        
+        # Verificar se é empresa
+        if claims.get('user_type') != 'company':
+            return jsonify({'error': 'Acesso negado. Apenas empresas podem criar vagas'}), 403
+        
+        # Empresa do usuário (resolvida uma vez por requisição, com cache)
+        company_id = get_current_company_id()
+        if not company_id:
+            return jsonify({'error': 'Perfil de empresa não encontrado. Crie um perfil primeiro'}), 404
+        
+        created = []
+        errors = []
+        items = _iter_bulk_items()
+        while True:
+            chunk = list(islice(items, BULK_CHUNK_SIZE))
+            if not chunk:
+                break
+            created.extend(_insert_bulk_chunk(company_id, chunk, errors))
+        
+        if created:
+            invalidate_jobs()
+            # Inserts em lote não passam pelos eventos do ORM
+            job_suggest_index.invalidate()
+            platform_counters.adjust(ACTIVE_JOBS, len(created))
+        
+        errors.sort(key=lambda error: error['index'])
+        return jsonify({
+            'message': f'{len(created)} vaga(s) criada(s)',
+            'created': len(created),
+            'failed': len(errors),
+            'jobs': [{'index': index, 'id': job_id} for index, job_id in created],
+            'errors': errors
+        }), 207 if errors else 201
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+# Filtros aceitos por POST /api/jobs/bulk/status e /bulk/delete
+BULK_ACTION_FILTERS = ('is_active', 'area_id', 'contract_type', 'city', 'state', 'created_before', 'created_after')
+
+
+def _bulk_action_targets(company_id, data):
+    """
+    Vagas da empresa selecionadas por {"ids": [...]} ou {"filter": {...}}
+    A posse é verificada na própria query (company_id). Retorna
+    ([(id, is_active)], ids pedidos que não existem ou são de outra empresa)
+    """
+    if not isinstance(data, dict):
+        raise ValueError('Envie {"ids": [...]} ou {"filter": {...}}')
+    
+    targets_query = db.session.query(Job.id, Job.is_active).filter(Job.company_id == company_id)
+    
+    if 'ids' in data:
+        ids = data['ids']
+        # bool é subclasse de int: True/False não são os IDs 1/0
+        if not isinstance(ids, list) or not ids or not all(
+            isinstance(job_id, int) and not isinstance(job_id, bool) for job_id in ids
+        ):
+            raise ValueError('ids deve ser uma lista não vazia de IDs de vagas')
+        requested = set(ids)
+        targets = []
+        for chunk in chunked(requested, BULK_CHUNK_SIZE):
+            targets.extend(targets_query.filter(Job.id.in_(chunk)).all())
+        skipped = sorted(requested - {job_id for job_id, _ in targets})
+        return targets, skipped
+    
+    filters = data.get('filter')
+    if not isinstance(filters, dict) or not filters:
+        raise ValueError('Envie {"ids": [...]} ou um filter não vazio')
+    unknown = set(filters) - set(BULK_ACTION_FILTERS)
+    if unknown:
+        raise ValueError(f"Filtros não suportados: {', '.join(sorted(unknown))}")
+    
+    if 'is_active' in filters:
+        # Só um booleano JSON: bool("false") seria True
+        if not isinstance(filters['is_active'], bool):
+            raise ValueError('filter.is_active deve ser true ou false')
+        targets_query = targets_query.filter(Job.is_active == filters['is_active'])
+    if filters.get('area_id'):
+        targets_query = targets_query.filter(Job.area_id == _parse_area_id(filters['area_id']))
+    if filters.get('contract_type'):
+        targets_query = targets_query.filter(Job.contract_type == filters['contract_type'])
+    if filters.get('city'):
+        targets_query = targets_query.filter(Job.city_key == normalize_key(filters['city']))
+    if filters.get('state'):
+        targets_query = targets_query.filter(Job.state_key == normalize_key(filters['state']))
+    if filters.get('created_before'):
+        targets_query = targets_query.filter(Job.created_at < datetime.fromisoformat(filters['created_before']))
+    if filters.get('created_after'):
+        targets_query = targets_query.filter(Job.created_at >= datetime.fromisoformat(filters['created_after']))
+    
+    return targets_query.all(), []
+
+
+def _invalidate_bulk_action(job_ids, active_delta):
+    """Invalidar caches, contadores e sugestões após alterações por SQL direto"""
+    invalidate_jobs(job_ids=job_ids)
+    job_suggest_index.invalidate()
+    if active_delta:
+        platform_counters.adjust(ACTIVE_JOBS, active_delta)
+
+
+@jobs_bp.route('/bulk/status', methods=['POST'])
+@jwt_required()
+def bulk_update_job_status():
+    """
+    Ativar ou pausar várias vagas da empresa de uma vez
+    Corpo: {"is_active": bool, "ids": [...]} ou {"is_active": bool, "filter": {...}}
+    Um UPDATE por lote de BULK_CHUNK_SIZE vagas, tudo em uma transação
+    """
+    try:
+        claims = get_jwt()
+        
+        # Verificar se é empresa
+        if claims.get('user_type') != 'company':
+            return jsonify({'error': 'Acesso negado'}), 403
+        
+        # Empresa do usuário (resolvida uma vez por requisição, com cache)
+        company_id = get_current_company_id()
+        if not company_id:
+            return jsonify({'error': 'Perfil de empresa não encontrado'}), 404
+        
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict) or not isinstance(data.get('is_active'), bool):
+            return jsonify({'error': 'is_active (true/false) é obrigatório'}), 400
+        is_active = data['is_active']
+        
+        targets, skipped = _bulk_action_targets(company_id, data)
+        
+        # Só as vagas que de fato mudam de status
+        job_ids = [job_id for job_id, active in targets if bool(active) != is_active]
+        now = datetime.utcnow()
+        for chunk in chunked(job_ids, BULK_CHUNK_SIZE):
+            db.session.execute(
+                update(Job)
+                .where(Job.id.in_(chunk), Job.company_id == company_id)
+                .values(is_active=is_active, updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+        db.session.commit()
+        
+        if job_ids:
+            _invalidate_bulk_action(job_ids, len(job_ids) if is_active else -len(job_ids))
+        
+        return jsonify({
+            'message': f'{len(job_ids)} vaga(s) {"ativada(s)" if is_active else "pausada(s)"}',
+            'matched': len(targets),
+            'updated': len(job_ids),
+            'skipped': skipped
+        }), 200
+        
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+@jobs_bp.route('/bulk/delete', methods=['POST'])
+@jwt_required()
+def bulk_delete_jobs():
+    """
+    Deletar várias vagas da empresa de uma vez
+    Corpo: {"ids": [...]} ou {"filter": {...}}
+    Skills, candidaturas e vagas são removidas com DELETEs por lote, em uma transação
+    """
+    try:
+        claims = get_jwt()
+        
+        # Verificar se é empresa
+        if claims.get('user_type') != 'company':
+            return jsonify({'error': 'Acesso negado'}), 403
+        
+        # Empresa do usuário (resolvida uma vez por requisição, com cache)
+        company_id = get_current_company_id()
+        if not company_id:
+            return jsonify({'error': 'Perfil de empresa não encontrado'}), 404
+        
+        targets, skipped = _bulk_action_targets(company_id, request.get_json(silent=True))
+        
+        job_ids = [job_id for job_id, _ in targets]
+        for chunk in chunked(job_ids, BULK_CHUNK_SIZE):
+            # Mesmo efeito do cascade de Job.skills/Job.applications, sem carregar os objetos
+            db.session.execute(
+                delete(JobSkill).where(JobSkill.job_id.in_(chunk))
+                .execution_options(synchronize_session=False)
+            )
+            db.session.execute(
+                delete(Application).where(Application.job_id.in_(chunk))
+                .execution_options(synchronize_session=False)
+            )
+            db.session.execute(
+                delete(Job).where(Job.id.in_(chunk), Job.company_id == company_id)
+                .execution_options(synchronize_session=False)
+            )
+        db.session.commit()
+        
+        if job_ids:
+            _invalidate_bulk_action(job_ids, -sum(1 for _, active in targets if active))
+        
+        return jsonify({
+            'message': f'{len(job_ids)} vaga(s) deletada(s)',
+            'deleted': len(job_ids),
+            'skipped': skipped
+        }), 200
+        
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
 @jobs_bp.route('/<int:job_id>', methods=['PUT'])
 @jwt_required()
 def update_job(job_id):
@@ -272,16 +851,15 @@ def update_job(job_id):
     Atualizar vaga existente (apenas empresa dona da vaga)
     """
     try:
-        current_user_id = get_jwt_identity()
         claims = get_jwt()
         
         # Verificar se é empresa
         if claims.get('user_type') != 'company':
             return jsonify({'error': 'Acesso negado'}), 403
         
-        # Buscar empresa
-        company = Company.query.filter_by(user_id=current_user_id).first()
-        if not company:
+        # Empresa do usuário (resolvida uma vez por requisição, com cache)
+        company_id = get_current_company_id()
+        if not company_id:
             return jsonify({'error': 'Perfil de empresa não encontrado'}), 404
         
         # Buscar vaga
@@ -290,10 +868,11 @@ def update_job(job_id):
             return jsonify({'error': 'Vaga não encontrada'}), 404
         
         # Verificar se a vaga pertence à empresa
-        if job.company_id != company.id:
+        if job.company_id != company_id:
             return jsonify({'error': 'Você não tem permissão para editar esta vaga'}), 403
         
         data = request.get_json()
+        was_active = job.is_active
         
         # Atualizar campos básicos
         if 'title' in data:
@@ -305,14 +884,15 @@ def update_job(job_id):
         if 'benefits' in data:
             job.benefits = data['benefits']
         if 'area_id' in data:
-            area_id = data['area_id']
-            if area_id:
-                job_area = JobArea.query.get(area_id)
-                if not job_area:
-                    return jsonify({'error': f'Área com ID {area_id} não encontrada'}), 400
+            area_id = _parse_area_id(data['area_id'])
+            if area_id and not area_catalog.get(area_id):
+                return jsonify({'error': f'Área com ID {area_id} não encontrada'}), 400
             job.area_id = area_id
         if 'area' in data:
             job.area = data['area']
+            resolved_area_id = None if data.get('area_id') else area_catalog.resolve(data['area'])
+            if resolved_area_id:
+                job.area_id = resolved_area_id
         
         # Campos com compatibilidade de nomes
         if 'level' in data:
@@ -356,12 +936,17 @@ def update_job(job_id):
         job.updated_at = datetime.utcnow()
         
         db.session.commit()
+        invalidate_jobs(job.id)
+        platform_counters.adjust(ACTIVE_JOBS, int(bool(job.is_active)) - int(bool(was_active)))
         
         return jsonify({
             'message': 'Vaga atualizada com sucesso',
             'job': job.to_dict()
         }), 200
         
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
@@ -374,16 +959,15 @@ def delete_job(job_id):
     Deletar vaga (apenas empresa dona da vaga)
     """
     try:
-        current_user_id = get_jwt_identity()
         claims = get_jwt()
         
         # Verificar se é empresa
         if claims.get('user_type') != 'company':
             return jsonify({'error': 'Acesso negado'}), 403
         
-        # Buscar empresa
-        company = Company.query.filter_by(user_id=current_user_id).first()
-        if not company:
+        # Empresa do usuário (resolvida uma vez por requisição, com cache)
+        company_id = get_current_company_id()
+        if not company_id:
             return jsonify({'error': 'Perfil de empresa não encontrado'}), 404
         
         # Buscar vaga
@@ -392,11 +976,15 @@ def delete_job(job_id):
             return jsonify({'error': 'Vaga não encontrada'}), 404
         
         # Verificar se a vaga pertence à empresa
-        if job.company_id != company.id:
+        if job.company_id != company_id:
             return jsonify({'error': 'Você não tem permissão para deletar esta vaga'}), 403
         
+        was_active = job.is_active
         db.session.delete(job)
         db.session.commit()
+        invalidate_jobs(job_id)
+        if was_active:
+            platform_counters.adjust(ACTIVE_JOBS, -1)
         
         return jsonify({'message': 'Vaga deletada com sucesso'}), 200
         
@@ -405,6 +993,79 @@ def delete_job(job_id):
         return jsonify({'error': str(e)}), 500
 
 
+# Colunas da exportação de vagas (GET /api/jobs/my-jobs/export)
+EXPORT_JOB_COLUMNS = (
+    Job.id, Job.title, Job.area_id, Job.area, Job.seniority_level, Job.work_modality,
+    Job.contract_type, Job.min_salary, Job.max_salary, Job.salary_currency,
+    Job.city, Job.state, Job.country, Job.is_active, Job.applications_count,
+    Job.created_at, Job.updated_at, Job.expires_at
+)
+EXPORT_JOB_FIELDS = [column.key for column in EXPORT_JOB_COLUMNS] + ['area_name', 'skills']
+
+
+def _export_format():
+    """Formato pedido em ?format= (ndjson por padrão)"""
+    fmt = request.args.get('format', 'ndjson').lower()
+    return fmt if fmt in EXPORT_FORMATS else None
+
+
+def _iter_export_jobs(jobs_query):
+    """
+    Vagas da exportação como dicts, lidas por cursor no servidor
+    As skills de cada bloco vêm de uma única query IN (nomes pelo catálogo)
+    """
+    rows = jobs_query.with_entities(*EXPORT_JOB_COLUMNS).yield_per(EXPORT_CHUNK_SIZE)
+    for chunk in chunked(rows):
+        skills_by_job = {}
+        job_ids = [row.id for row in chunk]
+        for job_id, skill_id in db.session.query(JobSkill.job_id, JobSkill.skill_id).filter(JobSkill.job_id.in_(job_ids)):
+            name = skill_catalog.name(skill_id)
+            if name:
+                skills_by_job.setdefault(job_id, []).append(name)
+        
+        for row in chunk:
+            record = row._asdict()
+            area = area_catalog.get(row.area_id) if row.area_id else None
+            record['area_name'] = area['name'] if area else row.area
+            record['skills'] = skills_by_job.get(row.id, [])
+            yield record
+
+
+@jobs_bp.route('/my-jobs/export', methods=['GET'])
+@jwt_required()
+def export_my_company_jobs():
+    """
+    Exportar todas as vagas da empresa autenticada (NDJSON ou CSV, em streaming)
+    """
+    try:
+        claims = get_jwt()
+        
+        # Verificar se é empresa
+        if claims.get('user_type') != 'company':
+            return jsonify({'error': 'Acesso negado'}), 403
+        
+        # Empresa do usuário (resolvida uma vez por requisição, com cache)
+        company_id = get_current_company_id()
+        if not company_id:
+            return jsonify({'error': 'Perfil de empresa não encontrado'}), 404
+        
+        fmt = _export_format()
+        if not fmt:
+            return jsonify({'error': 'Formato inválido. Use ndjson ou csv'}), 400
+        
+        status = request.args.get('status', '')
+        jobs_query = Job.query.filter_by(company_id=company_id)
+        if status:
+            is_active = status in ['active', 'Active', True, 'true', '1']
+            jobs_query = jobs_query.filter_by(is_active=is_active)
+        jobs_query = jobs_query.order_by(Job.created_at.desc(), Job.id.desc())
+        
+        return stream_records(_iter_export_jobs(jobs_query), fmt, f'vagas-empresa-{company_id}', EXPORT_JOB_FIELDS)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @jobs_bp.route('/my-jobs', methods=['GET'])
 @jwt_required()
 def get_my_company_jobs():
@@ -412,46 +1073,54 @@ def get_my_company_jobs():
     Listar todas as vagas da empresa autenticada
     """
     try:
-        current_user_id = get_jwt_identity()
         claims = get_jwt()
         
         # Verificar se é empresa
         if claims.get('user_type') != 'company':
             return jsonify({'error': 'Acesso negado'}), 403
         
-        # Buscar empresa
-        company = Company.query.filter_by(user_id=current_user_id).first()
-        if not company:
+        # Empresa do usuário (resolvida uma vez por requisição, com cache)
+        company_id = get_current_company_id()
+        if not company_id:
             return jsonify({'error': 'Perfil de empresa não encontrado'}), 404
         
         # Buscar vagas da empresa
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 20, type=int)
         status = request.args.get('status', '')
         
-        jobs_query = Job.query.filter_by(company_id=company.id)
+        jobs_query = Job.query.filter_by(company_id=company_id)
         
         if status:
             # Converter status string para is_active boolean
             is_active = status in ['active', 'Active', True, 'true', '1']
             jobs_query = jobs_query.filter_by(is_active=is_active)
         
-        jobs_query = jobs_query.order_by(Job.created_at.desc())
+        jobs_query = jobs_query.options(*Job.list_loader_options())
         
-        pagination = jobs_query.paginate(page=page, per_page=per_page, error_out=False)
+        jobs, page_info = paginate_request(jobs_query, Job.created_at, Job.id)
         
         return jsonify({
-            'jobs': [j.to_dict() for j in pagination.items],
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'current_page': page,
-            'per_page': per_page
+            'jobs': [job.to_dict() for job in jobs],
+            **page_info
         }), 200
         
+    except InvalidCursor:
+        return jsonify({'error': 'Cursor de paginação inválido'}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def _application_loader_options():
+    """
+    selectinload dos relacionamentos many-to-one de Application (candidato etc.)
+    Evita um lazy load por linha em Application.to_dict(); a vaga já é conhecida
+    """
+    return [
+        selectinload(relationship.class_attribute)
+        for relationship in sa_inspect(Application).relationships
+        if relationship.direction is MANYTOONE and relationship.key != 'job'
+    ]
+
+
 @jobs_bp.route('/<int:job_id>/applications', methods=['GET'])
 @jwt_required()
 def get_job_applications(job_id):
@@ -459,30 +1128,27 @@ def get_job_applications(job_id):
     Listar todas as candidaturas de uma vaga (apenas empresa dona)
     """
     try:
-        current_user_id = get_jwt_identity()
         claims = get_jwt()
         
         # Verificar se é empresa
         if claims.get('user_type') != 'company':
             return jsonify({'error': 'Acesso negado'}), 403
         
-        # Buscar empresa
-        company = Company.query.filter_by(user_id=current_user_id).first()
-        if not company:
+        # Empresa do usuário (resolvida uma vez por requisição, com cache)
+        company_id = get_current_company_id()
+        if not company_id:
             return jsonify({'error': 'Perfil de empresa não encontrado'}), 404
         
-        # Buscar vaga
-        job = Job.query.get(job_id)
-        if not job:
+        # Buscar vaga (apenas a empresa dona, sem carregar a vaga inteira)
+        job_company_id = db.session.query(Job.company_id).filter(Job.id == job_id).scalar()
+        if job_company_id is None:
             return jsonify({'error': 'Vaga não encontrada'}), 404
         
         # Verificar se a vaga pertence à empresa
-        if job.company_id != company.id:
+        if job_company_id != company_id:
             return jsonify({'error': 'Você não tem permissão para ver as candidaturas desta vaga'}), 403
         
-        # Buscar candidaturas
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 20, type=int)
+        # Buscar candidaturas (índice job_id, status, applied_at)
         status = request.args.get('status', '')
         
         applications_query = Application.query.filter_by(job_id=job_id)
@@ -490,23 +1156,71 @@ def get_job_applications(job_id):
         if status:
             applications_query = applications_query.filter_by(status=status)
         
-        applications_query = applications_query.order_by(Application.applied_at.desc())
+        # Candidato e demais dados da página carregados em lote
+        applications_query = applications_query.options(*_application_loader_options())
         
-        pagination = applications_query.paginate(page=page, per_page=per_page, error_out=False)
+        # Paginação (page/per_page ou cursor), mais recentes primeiro
+        applications, page_info = paginate_request(applications_query, Application.applied_at, Application.id)
         
         return jsonify({
-            'applications': [a.to_dict() for a in pagination.items],
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'current_page': page,
-            'per_page': per_page
+            'applications': [a.to_dict() for a in applications],
+            **page_info
         }), 200
         
+    except InvalidCursor:
+        return jsonify({'error': 'Cursor de paginação inválido'}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 
+@jobs_bp.route('/<int:job_id>/applications/export', methods=['GET'])
+@jwt_required()
+def export_job_applications(job_id):
+    """
+    Exportar todas as candidaturas de uma vaga (NDJSON ou CSV, em streaming)
+    """
+    try:
+        claims = get_jwt()
+        
+        # Verificar se é empresa
+        if claims.get('user_type') != 'company':
+            return jsonify({'error': 'Acesso negado'}), 403
+        
+        # Empresa do usuário (resolvida uma vez por requisição, com cache)
+        company_id = get_current_company_id()
+        if not company_id:
+            return jsonify({'error': 'Perfil de empresa não encontrado'}), 404
+        
+        # Buscar vaga (apenas a empresa dona, sem carregar a vaga inteira)
+        job_company_id = db.session.query(Job.company_id).filter(Job.id == job_id).scalar()
+        if job_company_id is None:
+            return jsonify({'error': 'Vaga não encontrada'}), 404
+        
+        # Verificar se a vaga pertence à empresa
+        if job_company_id != company_id:
+            return jsonify({'error': 'Você não tem permissão para ver as candidaturas desta vaga'}), 403
+        
+        fmt = _export_format()
+        if not fmt:
+            return jsonify({'error': 'Formato inválido. Use ndjson ou csv'}), 400
+        
+        status = request.args.get('status', '')
+        applications_query = Application.query.filter_by(job_id=job_id)
+        if status:
+            applications_query = applications_query.filter_by(status=status)
+        applications_query = applications_query.order_by(Application.applied_at.desc(), Application.id.desc())
+        applications_query = applications_query.options(*_application_loader_options())
+        
+        # Cursor no servidor: blocos de EXPORT_CHUNK_SIZE linhas
+        records = (a.to_dict() for a in applications_query.yield_per(EXPORT_CHUNK_SIZE))
+        
+        return stream_records(records, fmt, f'candidaturas-vaga-{job_id}')
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @jobs_bp.route('/<int:job_id>/toggle-status', methods=['PATCH'])
 @jwt_required()
 def toggle_job_status(job_id):
@@ -514,16 +1228,15 @@ def toggle_job_status(job_id):
     Alternar status da vaga (ativar/pausar)
     """
     try:
-        current_user_id = get_jwt_identity()
         claims = get_jwt()
         
         # Verificar se é empresa
         if claims.get('user_type') != 'company':
             return jsonify({'error': 'Acesso negado'}), 403
         
-        # Buscar empresa
-        company = Company.query.filter_by(user_id=int(current_user_id)).first()
-        if not company:
+        # Empresa do usuário (resolvida uma vez por requisição, com cache)
+        company_id = get_current_company_id()
+        if not company_id:
             return jsonify({'error': 'Perfil de empresa não encontrado'}), 404
         
         # Buscar vaga
@@ -532,7 +1245,7 @@ def toggle_job_status(job_id):
             return jsonify({'error': 'Vaga não encontrada'}), 404
         
         # Verificar se a vaga pertence à empresa
-        if job.company_id != company.id:
+        if job.company_id != company_id:
             return jsonify({'error': 'Você não tem permissão para alterar esta vaga'}), 403
         
         # Alternar status
@@ -540,6 +1253,8 @@ def toggle_job_status(job_id):
         job.updated_at = datetime.utcnow()
         
         db.session.commit()
+        invalidate_jobs(job.id)
+        platform_counters.adjust(ACTIVE_JOBS, 1 if job.is_active else -1)
         
         return jsonify({
             'message': f'Vaga {"ativada" if job.is_active else "pausada"} com sucesso',
@@ -551,3 +1266,14 @@ def toggle_job_status(job_id):
         return jsonify({'error': str(e)}), 500
 
 
+@jobs_bp.cli.command('expire')
+def expire_jobs_command():
+    """
+    Desativar vagas vencidas (flask jobs expire)
+    Usa o mesmo lock da thread periódica para não varrer em paralelo com ela
+    """
+    deactivated = sweep_with_lock(current_app._get_current_object())
+    if deactivated is None:
+        print("Outra varredura está em andamento; nada feito")
+    else:
+        print(f"{deactivated} vaga(s) vencida(s) desativada(s)")
@@ -2,17 +2,37 @@
 Portal ERP Jobs API - Statistics Routes
 Endpoints para estatísticas da plataforma
 """
-from flask import Blueprint, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
-from sqlalchemy import func, and_
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt
+from sqlalchemy import func, and_, or_, case
 from src.config import db
-from src.models.user import User
-from src.models.candidate import Candidate
+from src.services.json_provider import install_json_provider
 from src.models.company import Company
 from src.models.job import Job
-from src.models.application import Application
+from src.services.catalogs import area_catalog
+from src.services.cache import response_cache, TAG_JOB_LISTS
+from src.services.counters import platform_counters
+from src.services.company_context import get_current_company_id
+from datetime import datetime
 
 stats_bp = Blueprint('stats', __name__, url_prefix='/api/stats')
+stats_bp.record_once(lambda state: install_json_provider(state.app))
+
+# Categorias do Portal ERP Jobs
+CATEGORIES = [
+    'Desenvolvimento',
+    'Consultoria & ERP',
+    'Suporte & Infraestrutura',
+    'Gestão & Liderança',
+    'Vendas & Pré-Vendas',
+    'Administrativo',
+    'DevOps & Cloud',
+    'Dados & Analytics',
+    'Segurança'
+]
+
+CATEGORIES_CACHE_KEY = 'stats:categories'
+CATEGORIES_CACHE_TTL = 300
 
 
 @stats_bp.route('/dashboard', methods=['GET'])
@@ -22,20 +42,8 @@ def get_dashboard_stats():
     Retorna estatísticas gerais da plataforma para a homepage
     """
     try:
-        # Contar vagas ativas
-        active_jobs = Job.query.filter_by(is_active=True).count()
-        
-        # Contar empresas cadastradas
-        total_companies = Company.query.count()
-        
-        # Contar candidatos cadastrados
-        total_candidates = Candidate.query.count()
-        
-        return jsonify({
-            'active_jobs': active_jobs,
-            'total_companies': total_companies,
-            'total_candidates': total_candidates
-        }), 200
+        # Contadores mantidos em memória (ver src/services/counters.py)
+        return jsonify(platform_counters.snapshot()), 200
         
     except Exception as e:
         print(f"Erro ao buscar estatísticas do dashboard: {str(e)}")
@@ -47,52 +55,84 @@ def get_categories_stats():
     """
     GET /api/stats/categories
     Retorna estatísticas por categoria com top vagas
+    Agrupa por area_id (uma query de contagem e uma de top vagas; vagas legadas
+    sem area_id agrupadas pelo texto de área) e fica em cache
+    até a próxima alteração de vagas
     """
     try:
-        # Categorias do Portal ERP Jobs
-        categories = [
-            'Desenvolvimento',
-            'Consultoria & ERP',
-            'Suporte & Infraestrutura',
-            'Gestão & Liderança',
-            'Vendas & Pré-Vendas',
-            'Administrativo',
-            'DevOps & Cloud',
-            'Dados & Analytics',
-            'Segurança'
-        ]
+        cached = response_cache.get(CATEGORIES_CACHE_KEY)
+        if cached is not None:
+            return jsonify(cached), 200
+        
+        # Áreas de cada categoria, resolvidas pelo catálogo em memória
+        # (nome da área contendo o nome da categoria)
+        category_area_ids = {
+            category: area_catalog.ids_matching(category)
+            for category in CATEGORIES
+        }
+        all_area_ids = set().union(*category_area_ids.values())
+        
+        # Vagas legadas sem area_id continuam casando pelo texto de área
+        legacy = Job.area_id.is_(None)
+        legacy_area = case((legacy, Job.area), else_=None)
+        active_in_categories = and_(Job.is_active == True, or_(
+            Job.area_id.in_(all_area_ids),
+            and_(legacy, or_(*[Job.area.ilike(f'%{category}%') for category in CATEGORIES]))
+        ))
+        
+        # Contagem de vagas ativas por área (id, ou texto nas legadas)
+        counts = {
+            (area_id, area): count
+            for area_id, area, count in db.session.query(Job.area_id, legacy_area, func.count(Job.id))
+            .filter(active_in_categories)
+            .group_by(Job.area_id, legacy_area)
+        }
+        
+        # Top 4 vagas mais recentes por área (window function)
+        rank = func.row_number().over(
+            partition_by=(Job.area_id, legacy_area),
+            order_by=(Job.created_at.desc(), Job.id.desc())
+        ).label('rank')
+        ranked = db.session.query(
+            Job.area_id, legacy_area.label('legacy_area'), Job.title, Job.created_at, rank
+        ).filter(active_in_categories).subquery()
+        top_by_area = {}
+        for area_id, area, title, created_at in db.session.query(
+            ranked.c.area_id, ranked.c.legacy_area, ranked.c.title, ranked.c.created_at
+        ).filter(ranked.c.rank <= 4).all():
+            top_by_area.setdefault((area_id, area), []).append((created_at, title))
         
         result = []
-        
-        for category in categories:
-            # Contar vagas ativas nesta categoria
-            jobs_count = Job.query.filter(
-                and_(
-                    Job.is_active == True,
-                    Job.area.ilike(f'%{category}%')
-                )
-            ).count()
+        for category in CATEGORIES:
+            area_ids = category_area_ids[category]
+            category_key = category.lower()
+            areas = [
+                (area_id, area) for area_id, area in counts
+                if area_id in area_ids or (area_id is None and area and category_key in area.lower())
+            ]
             
-            # Buscar top 4 vagas mais recentes desta categoria
-            top_jobs = Job.query.filter(
-                and_(
-                    Job.is_active == True,
-                    Job.area.ilike(f'%{category}%')
-                )
-            ).order_by(Job.created_at.desc()).limit(4).all()
+            # Juntar as áreas da categoria mantendo as 4 mais recentes
+            top_jobs = sorted(
+                (item for area in areas for item in top_by_area.get(area, [])),
+                key=lambda item: item[0] or datetime.min,
+                reverse=True
+            )[:4]
             
             # Formatar top jobs
-            job_titles = [job.title for job in top_jobs]
+            job_titles = [title for _, title in top_jobs]
             if len(job_titles) > 3:
                 job_titles = job_titles[:3] + ['+1 mais']
             
             result.append({
                 'category': category,
-                'jobs_count': jobs_count,
+                'jobs_count': sum(counts[area] for area in areas),
                 'top_jobs': job_titles
             })
         
-        return jsonify({'categories': result}), 200
+        payload = {'categories': result}
+        response_cache.set(CATEGORIES_CACHE_KEY, payload, ttl=CATEGORIES_CACHE_TTL, tags=(TAG_JOB_LISTS,))
+        
+        return jsonify(payload), 200
         
     except Exception as e:
         print(f"Erro ao buscar estatísticas de categorias: {str(e)}")
@@ -108,28 +148,25 @@ def get_company_stats():
     Requer autenticação
     """
     try:
-        current_user_id = get_jwt_identity()
+        claims = get_jwt()
         
-        # Buscar usuário e empresa
-        user = User.query.get(current_user_id)
-        if not user or user.user_type != 'company':
+        # Verificar se é empresa (claim do token, sem buscar o usuário)
+        if claims.get('user_type') != 'company':
             return jsonify({'error': 'Usuário não é uma empresa'}), 403
         
-        company = Company.query.filter_by(user_id=current_user_id).first()
-        if not company:
+        # Empresa do usuário (resolvida uma vez por requisição, com cache)
+        company_id = get_current_company_id()
+        if not company_id:
             return jsonify({'error': 'Empresa não encontrada'}), 404
+        company_name = db.session.query(Company.company_name).filter(Company.id == company_id).scalar()
         
-        # Buscar todas as vagas da empresa
-        all_jobs = Job.query.filter_by(company_id=company.id).all()
-        
-        # Contar vagas ativas
-        active_jobs = sum(1 for job in all_jobs if job.is_active)
-        
-        # Contar total de candidaturas recebidas
-        total_applications = 0
-        for job in all_jobs:
-            applications_count = Application.query.filter_by(job_id=job.id).count()
-            total_applications += applications_count
+        # Totais da empresa em uma única query agregada
+        # (candidaturas vêm do contador Job.applications_count)
+        total_jobs, active_jobs, total_applications = db.session.query(
+            func.count(Job.id),
+            func.coalesce(func.sum(case((Job.is_active == True, 1), else_=0)), 0),
+            func.coalesce(func.sum(Job.applications_count), 0)
+        ).filter(Job.company_id == company_id).one()
         
         # Calcular taxa de conversão (candidaturas / vagas ativas)
         conversion_rate = 0
@@ -139,15 +176,32 @@ def get_company_stats():
         # Total de visualizações (placeholder - implementar tracking depois)
         total_views = 0
         
-        return jsonify({
-            'total_jobs': len(all_jobs),
+        result = {
+            'total_jobs': total_jobs,
             'active_jobs': active_jobs,
-            'paused_jobs': len(all_jobs) - active_jobs,
+            'paused_jobs': total_jobs - active_jobs,
             'total_applications': total_applications,
             'total_views': total_views,
             'conversion_rate': conversion_rate,
-            'company_name': company.company_name
-        }), 200
+            'company_name': company_name
+        }
+        
+        # Detalhamento opcional por vaga (?breakdown=1), também em uma query
+        if request.args.get('breakdown') in ('1', 'true'):
+            jobs = db.session.query(
+                Job.id, Job.title, Job.is_active, Job.applications_count
+            ).filter(Job.company_id == company_id).order_by(Job.created_at.desc()).all()
+            result['jobs'] = [
+                {
+                    'id': job_id,
+                    'title': title,
+                    'is_active': is_active,
+                    'applications_count': applications_count or 0
+                }
+                for job_id, title, is_active, applications_count in jobs
+            ]
+        
+        return jsonify(result), 200
         
     except Exception as e:
         print(f"Erro ao buscar estatísticas da empresa: {str(e)}")
@@ -0,0 +1,210 @@
+"""
+Cache de respostas das rotas públicas
+
+Backends:
+- memory (padrão): LRU em processo, com TTL e limite de entradas
+- redis: compartilhado entre workers (CACHE_BACKEND=redis, REDIS_URL=...)
+
+Cada entrada recebe tags ('jobs:list', 'job:<id>', 'company:<id>') para que
+as rotas de escrita invalidem exatamente o que mudou.
+
+Configuração por variáveis de ambiente:
+CACHE_BACKEND, REDIS_URL, RESPONSE_CACHE_TTL, RESPONSE_CACHE_MAX_ENTRIES
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+from flask import request
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from src.services.json_provider import dumps_bytes, loads
+
+TAG_JOB_LISTS = 'jobs:list'
+
+
+def job_tag(job_id):
+    return f'job:{job_id}'
+
+
+def company_tag(company_id):
+    return f'company:{company_id}'
+
+
+class MemoryCache:
+    """Cache LRU com TTL, em memória do processo"""
+    
+    def __init__(self, max_entries=1024, default_ttl=30):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value, tags)
+        self._tags = {}  # tag -> set(keys)
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def set(self, key, value, ttl=None, tags=()):
+        expires_at = time.monotonic() + (ttl or self.default_ttl)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (expires_at, value, tuple(tags))
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            # Evicção LRU
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+    
+    def invalidate_tags(self, *tags):
+        with self._lock:
+            for tag in tags:
+                for key in self._tags.pop(tag, ()):
+                    self._remove(key)
+    
+    def invalidate_key(self, key):
+        with self._lock:
+            self._remove(key)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+    
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class RedisCache:
+    """Cache compartilhado em Redis, com a mesma interface de MemoryCache"""
+    
+    def __init__(self, url, default_ttl=30, prefix='portal_erp_jobs:cache:'):
+        import redis
+        self._client = redis.Redis.from_url(url)
+        self._errors = redis.RedisError
+        self.default_ttl = default_ttl
+        self.prefix = prefix
+    
+    def get(self, key):
+        try:
+            raw = self._client.get(self.prefix + key)
+        except self._errors:
+            return None
+        return loads(raw) if raw is not None else None
+    
+    def set(self, key, value, ttl=None, tags=()):
+        ttl = ttl or self.default_ttl
+        full_key = self.prefix + key
+        try:
+            pipe = self._client.pipeline()
+            pipe.setex(full_key, ttl, dumps_bytes(value))
+            for tag in tags:
+                tag_key = f'{self.prefix}tag:{tag}'
+                pipe.sadd(tag_key, full_key)
+                pipe.expire(tag_key, ttl * 2)
+            pipe.execute()
+        except self._errors:
+            pass
+    
+    def invalidate_key(self, key):
+        try:
+            self._client.delete(self.prefix + key)
+        except self._errors:
+            pass
+    
+    def invalidate_tags(self, *tags):
+        try:
+            for tag in tags:
+                tag_key = f'{self.prefix}tag:{tag}'
+                keys = self._client.smembers(tag_key)
+                self._client.delete(tag_key, *keys)
+        except self._errors:
+            pass
+    
+    def clear(self):
+        try:
+            keys = list(self._client.scan_iter(self.prefix + '*'))
+            if keys:
+                self._client.delete(*keys)
+        except self._errors:
+            pass
+
+
+def create_cache():
+    """Instanciar o backend configurado (memory se redis não estiver disponível)"""
+    ttl = int(os.environ.get('RESPONSE_CACHE_TTL', 30))
+    backend = os.environ.get('CACHE_BACKEND', 'memory')
+    
+    if backend == 'redis':
+        try:
+            return RedisCache(os.environ.get('REDIS_URL', 'redis://localhost:6379/0'), default_ttl=ttl)
+        except ImportError:
+            print("[WARN] CACHE_BACKEND=redis mas o pacote 'redis' não está instalado; usando cache em memória")
+    
+    max_entries = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', 1024))
+    return MemoryCache(max_entries=max_entries, default_ttl=ttl)
+
+
+response_cache = create_cache()
+
+
+# Parâmetros cuja simples presença muda a resposta: ?cursor= (vazio) pede a
+# primeira página keyset, diferente da listagem por page/per_page
+PRESENCE_PARAMS = ('cursor',)
+
+
+def request_cache_key(prefix):
+    """Chave normalizada a partir dos parâmetros da requisição (ordem e vazios ignorados)"""
+    params = sorted(
+        (name, value.strip())
+        for name, value in request.args.items(multi=True)
+        if value.strip() or name in PRESENCE_PARAMS
+    )
+    return f'{prefix}?{urlencode(params)}'
+
+
+def invalidate_jobs(job_id=None, job_ids=()):
+    """Invalidar listagens e, se informados, os detalhes das vagas"""
+    tags = [TAG_JOB_LISTS]
+    if job_id:
+        tags.append(job_tag(job_id))
+    tags.extend(job_tag(other_id) for other_id in job_ids)
+    response_cache.invalidate_tags(*tags)
+
+
+def invalidate_company(company_id):
+    """Invalidar respostas que exibem dados do perfil da empresa"""
+    response_cache.invalidate_tags(company_tag(company_id))
+
+
+def invalidate_after_commit(session, *tags):
+    """Agendar a invalidação de tags para depois do commit da sessão"""
+    session.info.setdefault('dirty_cache_tags', set()).update(tags)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_dirty_tags(session):
+    tags = session.info.pop('dirty_cache_tags', None)
+    if tags:
+        response_cache.invalidate_tags(*tags)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_dirty_tags(session):
+    session.info.pop('dirty_cache_tags', None)
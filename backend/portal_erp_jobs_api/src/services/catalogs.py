@@ -0,0 +1,162 @@
+"""
+Catálogos pequenos e quase imutáveis mantidos em memória do processo
+
+Cada catálogo é carregado com uma única query e recarregado quando sua
+versão muda (alterações commitadas no model correspondente) ou após
+CATALOG_TTL segundos, o que cobre alterações feitas por outros workers.
+Alterações feitas por SQL direto (fora do ORM) devem chamar invalidate().
+"""
+import os
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from src.config import db
+
+CATALOG_TTL = int(os.environ.get('CATALOG_TTL', 300))
+
+
+class Catalog:
+    """Cache versionado de uma tabela de referência"""
+    
+    def __init__(self, ttl=CATALOG_TTL):
+        self.ttl = ttl
+        self.version = 0
+        self._data = None
+        self._loaded_version = None
+        self._loaded_at = 0.0
+        self._watching = False
+        self._lock = threading.Lock()
+    
+    def model(self):
+        """Model observado pelo catálogo"""
+        raise NotImplementedError
+    
+    def load(self):
+        """Carregar o conteúdo do catálogo (uma query)"""
+        raise NotImplementedError
+    
+    def data(self):
+        """Conteúdo atual do catálogo, recarregando se necessário"""
+        data = self._data
+        if (
+            data is None
+            or self._loaded_version != self.version
+            or time.monotonic() - self._loaded_at >= self.ttl
+        ):
+            with self._lock:
+                if not self._watching:
+                    watch_model(self.model(), self)
+                    self._watching = True
+                version = self.version
+                data = self.load()
+                self._data = data
+                self._loaded_version = version
+                self._loaded_at = time.monotonic()
+        return data
+    
+    def invalidate(self):
+        """Descartar o conteúdo carregado (nova versão)"""
+        self.version += 1
+
+
+class SkillCatalog(Catalog):
+    """Skills por id: {'id', 'name', 'category'}"""
+    
+    def model(self):
+        from src.models.job import Skill
+        return Skill
+    
+    def load(self):
+        Skill = self.model()
+        rows = db.session.query(Skill.id, Skill.name, Skill.category).all()
+        return {
+            skill_id: {'id': skill_id, 'name': name, 'category': category}
+            for skill_id, name, category in rows
+        }
+    
+    def get(self, skill_id):
+        return self.data().get(skill_id)
+    
+    def name(self, skill_id):
+        skill = self.data().get(skill_id)
+        return skill['name'] if skill else None
+    
+    def existing_ids(self, skill_ids):
+        """Subconjunto de skill_ids que existe no catálogo"""
+        data = self.data()
+        return {skill_id for skill_id in skill_ids if skill_id in data}
+
+
+class AreaCatalog(Catalog):
+    """Áreas de atuação por id: {'id', 'name', 'icon', 'color'}"""
+    
+    def model(self):
+        from src.models.job_area import JobArea
+        return JobArea
+    
+    def load(self):
+        JobArea = self.model()
+        rows = db.session.query(JobArea.id, JobArea.name, JobArea.icon, JobArea.color).order_by(JobArea.id).all()
+        return {
+            area_id: {'id': area_id, 'name': name, 'icon': icon, 'color': color}
+            for area_id, name, icon, color in rows
+        }
+    
+    def get(self, area_id):
+        return self.data().get(area_id)
+    
+    def as_list(self):
+        """Todas as áreas, em ordem de id (formato de /config/areas)"""
+        return list(self.data().values())
+    
+    def ids_matching(self, text):
+        """IDs das áreas cujo nome contém o texto (equivale ao antigo ilike '%texto%')"""
+        text = (text or '').strip().lower()
+        return {
+            area_id for area_id, area in self.data().items()
+            if text and area['name'] and text in area['name'].lower()
+        }
+    
+    def resolve(self, text):
+        """
+        Mapear o texto legado de área para um id
+        Casamento exato primeiro, depois parcial (mesma regra de migrations/add_area_id_to_jobs.py)
+        """
+        text = (text or '').strip().lower()
+        if not text:
+            return None
+        areas = [(area_id, (area['name'] or '').lower()) for area_id, area in self.data().items()]
+        for area_id, name in areas:
+            if name == text:
+                return area_id
+        for area_id, name in areas:
+            if name and (text in name or name in text):
+                return area_id
+        return None
+
+
+skill_catalog = SkillCatalog()
+area_catalog = AreaCatalog()
+
+
+def watch_model(model, catalog):
+    """Invalidar o catálogo após o commit de qualquer alteração em model"""
+    def mark_dirty(mapper, connection, target):
+        session = Session.object_session(target)
+        if session is not None:
+            session.info.setdefault('dirty_catalogs', set()).add(catalog)
+    
+    for event_name in ('after_insert', 'after_update', 'after_delete'):
+        event.listen(model, event_name, mark_dirty)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_dirty_catalogs(session):
+    for catalog in session.info.pop('dirty_catalogs', ()):
+        catalog.invalidate()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_dirty_catalogs(session):
+    session.info.pop('dirty_catalogs', None)
@@ -0,0 +1,55 @@
+"""
+Resolução da empresa do usuário autenticado
+
+A empresa é resolvida uma vez por requisição (flask.g) e o mapeamento
+user_id -> company_id fica num cache com TTL. Se o token trouxer a claim
+'company_id' (assinada junto com o JWT), nenhuma query é necessária.
+O cache é atualizado quando o perfil é criado (remember_company).
+"""
+import os
+from flask import g
+from flask_jwt_extended import get_jwt, get_jwt_identity
+from src.config import db
+from src.models.company import Company
+from src.services.cache import MemoryCache
+
+_company_ids = MemoryCache(
+    max_entries=int(os.environ.get('COMPANY_ID_CACHE_MAX_ENTRIES', 10000)),
+    default_ttl=int(os.environ.get('COMPANY_ID_CACHE_TTL', 300))
+)
+
+
+def get_current_company_id():
+    """ID da empresa do usuário autenticado, ou None se ainda não há perfil"""
+    if 'company_id' in g:
+        return g.company_id
+    
+    company_id = get_jwt().get('company_id')
+    if company_id is None:
+        user_id = str(get_jwt_identity())
+        company_id = _company_ids.get(user_id)
+        if company_id is None:
+            company_id = db.session.query(Company.id).filter_by(user_id=user_id).scalar()
+            if company_id is not None:
+                _company_ids.set(user_id, company_id)
+    
+    g.company_id = company_id
+    return company_id
+
+
+def get_current_company():
+    """Empresa do usuário autenticado (objeto completo), ou None"""
+    company_id = get_current_company_id()
+    return db.session.get(Company, company_id) if company_id else None
+
+
+def remember_company(user_id, company_id):
+    """Registrar o perfil recém-criado (cache e requisição atual)"""
+    _company_ids.set(str(user_id), company_id)
+    g.company_id = company_id
+
+
+def forget_company(user_id):
+    """Remover o mapeamento de um usuário (ex.: perfil excluído)"""
+    _company_ids.invalidate_key(str(user_id))
+    g.pop('company_id', None)
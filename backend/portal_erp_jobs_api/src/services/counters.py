@@ -0,0 +1,86 @@
+"""
+Contadores da plataforma para GET /api/stats/dashboard
+
+Os valores ficam em memória e são ajustados pelas rotas de escrita
+(criação, edição, exclusão e ativação/pausa de vagas, criação de empresas).
+A cada PLATFORM_COUNTERS_RECONCILE_SECONDS eles são recalculados com uma
+única query, corrigindo qualquer desvio (ex.: cadastros feitos por outro
+worker ou candidatos criados fora destas rotas).
+"""
+import os
+import threading
+import time
+from sqlalchemy import func, select
+from src.config import db
+from src.models.job import Job
+from src.models.company import Company
+from src.models.candidate import Candidate
+
+ACTIVE_JOBS = 'active_jobs'
+TOTAL_COMPANIES = 'total_companies'
+TOTAL_CANDIDATES = 'total_candidates'
+
+
+class PlatformCounters:
+    """Contadores agregados com reconciliação periódica"""
+    
+    def __init__(self, reconcile_interval=30):
+        self.reconcile_interval = reconcile_interval
+        self._values = None
+        self._reconciled_at = 0.0
+        self._reconciling = False
+        self._lock = threading.Lock()
+    
+    def snapshot(self):
+        """Valores atuais, reconciliando se estiverem vencidos"""
+        with self._lock:
+            stale = time.monotonic() - self._reconciled_at >= self.reconcile_interval
+            must_wait = self._values is None
+            should_reconcile = stale and (must_wait or not self._reconciling)
+            if should_reconcile:
+                self._reconciling = True
+        
+        if should_reconcile:
+            try:
+                self.reconcile()
+            finally:
+                with self._lock:
+                    self._reconciling = False
+        
+        with self._lock:
+            return dict(self._values)
+    
+    def reconcile(self):
+        """Recalcular todos os contadores com uma única query"""
+        stmt = select(
+            select(func.count(Job.id)).where(Job.is_active == True).scalar_subquery(),
+            select(func.count(Company.id)).scalar_subquery(),
+            select(func.count(Candidate.id)).scalar_subquery()
+        )
+        active_jobs, total_companies, total_candidates = db.session.execute(stmt).one()
+        
+        with self._lock:
+            self._values = {
+                ACTIVE_JOBS: active_jobs,
+                TOTAL_COMPANIES: total_companies,
+                TOTAL_CANDIDATES: total_candidates
+            }
+            self._reconciled_at = time.monotonic()
+    
+    def adjust(self, name, delta):
+        """Aplicar uma variação após um commit bem-sucedido"""
+        if not delta:
+            return
+        with self._lock:
+            if self._values is not None:
+                self._values[name] = max(0, self._values[name] + delta)
+    
+    def invalidate(self):
+        """Forçar reconciliação na próxima leitura"""
+        with self._lock:
+            self._reconciled_at = 0.0
+
+
+platform_counters = PlatformCounters(
+    reconcile_interval=int(os.environ.get('PLATFORM_COUNTERS_RECONCILE_SECONDS', 30))
+)
@@ -0,0 +1,106 @@
+"""
+Desativação de vagas vencidas (Job.expires_at)
+
+As vagas com expires_at no passado são desativadas em lotes de
+EXPIRY_BATCH_SIZE, cada lote com um único UPDATE ... WHERE id IN (...)
+e seu próprio commit. Após cada lote as respostas em cache das vagas,
+o contador de vagas ativas e o índice de sugestões são atualizados.
+Assim as listagens não precisam do predicado expires_at > agora.
+
+Duas formas de rodar:
+- CLI: flask jobs expire (ex.: via cron)
+- Thread periódica no processo, ligada com EXPIRY_SWEEP_INTERVAL > 0.
+  Um flock em EXPIRY_LOCK_FILE garante que só um worker da máquina
+  varre por vez; os demais pulam a rodada. O UPDATE é idempotente, então
+  uma varredura concorrente em outra máquina apenas não encontra nada.
+"""
+import fcntl
+import os
+import threading
+from datetime import datetime
+from sqlalchemy import update
+from src.config import db
+from src.models.job import Job
+from src.services.cache import invalidate_jobs
+from src.services.counters import platform_counters, ACTIVE_JOBS
+from src.services.prefix_index import job_suggest_index
+
+EXPIRY_BATCH_SIZE = int(os.environ.get('EXPIRY_BATCH_SIZE', 500))
+EXPIRY_SWEEP_INTERVAL = int(os.environ.get('EXPIRY_SWEEP_INTERVAL', 0))
+EXPIRY_LOCK_FILE = os.environ.get('EXPIRY_LOCK_FILE', '/tmp/portal_erp_jobs_expiry.lock')
+
+_sweeper_started = False
+
+
+def deactivate_expired_jobs(now=None, batch_size=EXPIRY_BATCH_SIZE):
+    """Desativar as vagas ativas vencidas até `now`; retorna quantas foram desativadas"""
+    now = now or datetime.utcnow()
+    total = 0
+    
+    while True:
+        # Servido por ix_jobs_active_expires (is_active, expires_at)
+        job_ids = [job_id for (job_id,) in db.session.query(Job.id).filter(
+            Job.is_active == True,
+            Job.expires_at <= now
+        ).order_by(Job.expires_at).limit(batch_size)]
+        if not job_ids:
+            break
+        
+        result = db.session.execute(
+            update(Job)
+            .where(Job.id.in_(job_ids), Job.is_active == True)
+            .values(is_active=False, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        
+        # UPDATE direto não passa pelos eventos do ORM
+        invalidate_jobs(job_ids=job_ids)
+        platform_counters.adjust(ACTIVE_JOBS, -result.rowcount)
+        job_suggest_index.invalidate()
+        total += result.rowcount
+        
+        if len(job_ids) < batch_size:
+            break
+    
+    return total
+
+
+def sweep_with_lock(app):
+    """
+    Uma varredura, se nenhum outro processo da máquina estiver varrendo.
+    Retorna o número de vagas desativadas, ou None se a rodada foi pulada.
+    """
+    with open(EXPIRY_LOCK_FILE, 'a') as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return None
+        try:
+            with app.app_context():
+                try:
+                    return deactivate_expired_jobs()
+                finally:
+                    db.session.remove()
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def start_expiry_sweeper(app, interval=EXPIRY_SWEEP_INTERVAL):
+    """Iniciar a thread periódica (uma por processo); interval <= 0 desliga"""
+    global _sweeper_started
+    if interval <= 0 or _sweeper_started:
+        return
+    _sweeper_started = True
+    stop = threading.Event()
+    
+    def run():
+        while not stop.wait(interval):
+            try:
+                deactivated = sweep_with_lock(app)
+                if deactivated:
+                    app.logger.info('%s vaga(s) vencida(s) desativada(s)', deactivated)
+            except Exception:
+                app.logger.exception('Falha na desativação de vagas vencidas')
+    
+    threading.Thread(target=run, name='job-expiry-sweeper', daemon=True).start()
@@ -0,0 +1,77 @@
+"""
+Exportação em streaming (NDJSON ou CSV)
+
+Os registros são consumidos de um iterador (tipicamente uma query com
+yield_per, ou seja, cursor no servidor) e enviados em blocos de tamanho
+fixo, mantendo a memória constante independentemente do volume.
+"""
+import csv
+import io
+from itertools import islice
+from flask import Response, stream_with_context
+from src.services.json_provider import dumps_bytes
+
+EXPORT_CHUNK_SIZE = 1000
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+def chunked(iterable, size=EXPORT_CHUNK_SIZE):
+    """Agrupar um iterável em listas de até size itens"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return '; '.join(value)
+    if isinstance(value, (dict, list)):
+        return dumps_bytes(value).decode()
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+def _ndjson_stream(records):
+    for chunk in chunked(records):
+        yield b''.join(dumps_bytes(record) + b'\n' for record in chunk)
+
+
+def _csv_stream(records, fieldnames):
+    buffer = io.StringIO()
+    writer = None
+    for chunk in chunked(records):
+        for record in chunk:
+            if writer is None:
+                # Sem colunas fixas, usa as chaves do primeiro registro
+                writer = csv.DictWriter(buffer, fieldnames=fieldnames or list(record), extrasaction='ignore')
+                writer.writeheader()
+            writer.writerow({key: _csv_value(value) for key, value in record.items()})
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate(0)
+    if writer is None and fieldnames:
+        csv.writer(buffer).writerow(fieldnames)
+        yield buffer.getvalue().encode('utf-8')
+
+
+def stream_records(records, fmt, filename, fieldnames=None):
+    """Response em streaming com os registros no formato pedido"""
+    if fmt == 'csv':
+        body = _csv_stream(records, fieldnames)
+    else:
+        body = _ndjson_stream(records)
+    
+    return Response(
+        stream_with_context(body),
+        content_type=EXPORT_FORMATS[fmt],
+        headers={'Content-Disposition': f'attachment; filename="{filename}.{fmt}"'}
+    )
@@ -0,0 +1,58 @@
+"""
+GET condicional (ETag / Last-Modified)
+
+Os validadores são calculados a partir das datas de atualização (e de
+contadores que aparecem na resposta), sem carregar relacionamentos nem
+serializar nada. Quando o cliente já tem a versão atual, a rota devolve
+304 sem corpo.
+
+Nas listagens a ETag vem das linhas da página já buscada (ids, datas e
+metadados de paginação), sem agregados sobre todo o conjunto filtrado, e
+não há Last-Modified: a exclusão de uma vaga não muda max(updated_at).
+"""
+import calendar
+import hashlib
+from flask import current_app, request, jsonify
+
+
+def compute_etag(*parts):
+    """ETag (fraca) derivada dos valores que determinam a resposta"""
+    raw = '|'.join('' if part is None else str(part) for part in parts)
+    return hashlib.sha1(raw.encode()).hexdigest()[:24]
+
+
+def last_modified_timestamp(*datetimes):
+    """Maior data (UTC, sem timezone) como timestamp em segundos"""
+    values = [calendar.timegm(dt.utctimetuple()) for dt in datetimes if dt is not None]
+    return max(values) if values else None
+
+
+def is_not_modified(etag, last_modified=None):
+    """A requisição condicional já tem esta versão?"""
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if last_modified is not None and request.if_modified_since is not None:
+        return last_modified <= request.if_modified_since.timestamp()
+    return False
+
+
+def _set_validators(response, etag, last_modified):
+    response.set_etag(etag, weak=True)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    # Sempre revalidar: permite responder 304 sem servir conteúdo velho
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def not_modified_response(etag, last_modified=None):
+    """Resposta 304 com os validadores atuais"""
+    response = current_app.response_class(status=304)
+    return _set_validators(response, etag, last_modified)
+
+
+def conditional_json(payload, etag, last_modified=None):
+    """jsonify(payload) com validadores, ou 304 se o cliente já tem esta versão"""
+    if is_not_modified(etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    return _set_validators(jsonify(payload), etag, last_modified)
@@ -0,0 +1,75 @@
+"""
+Codificação JSON das respostas da API
+
+Usa orjson quando instalado e cai para o json da biblioteca padrão caso
+contrário. Nos dois casos datetime/date saem em ISO 8601 (como isoformat()),
+então os to_dict() podem devolver as datas sem pré-formatá-las.
+
+O provider é instalado pelos blueprints (install_json_provider) e passa a
+valer para todo jsonify() da aplicação.
+"""
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende do ambiente
+    orjson = None
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+
+def _default(value):
+    """Tipos que nenhum dos encoders trata nativamente"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def dumps_bytes(obj):
+    """Serializar para bytes UTF-8 pelo caminho mais rápido disponível"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS)
+    return json.dumps(obj, default=_default, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def dumps(obj):
+    return dumps_bytes(obj).decode()
+
+
+def loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider do Flask baseado em dumps_bytes()"""
+    
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            # Chamadas com opções específicas (indent, sort_keys...) usam a stdlib
+            kwargs.setdefault('default', _default)
+            return json.dumps(obj, **kwargs)
+        return dumps(obj)
+    
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj), mimetype=self.mimetype)
+
+
+def install_json_provider(app):
+    """Trocar o JSON provider da aplicação (idempotente)"""
+    if not isinstance(app.json, FastJSONProvider):
+        app.json = FastJSONProvider(app)
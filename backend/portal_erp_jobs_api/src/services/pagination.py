@@ -0,0 +1,100 @@
+"""
+Paginação das listagens
+
+Dois modos, escolhidos pelos parâmetros da requisição:
+- page/per_page: paginação por OFFSET, como antes (com COUNT a cada página)
+- cursor: paginação keyset sobre (coluna de ordenação, id). O cursor é opaco,
+  o custo não cresce com a profundidade da página e o total só é contado
+  na primeira página (cursor vazio) ou com include_total=1
+"""
+import base64
+import json
+from datetime import datetime
+from flask import request
+from sqlalchemy import and_, or_
+
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 100
+
+
+class InvalidCursor(ValueError):
+    """Cursor de paginação malformado ou adulterado"""
+
+
+def get_per_page(default=DEFAULT_PER_PAGE):
+    """per_page da requisição, limitado a MAX_PER_PAGE"""
+    per_page = request.args.get('per_page', default, type=int) or default
+    return max(1, min(per_page, MAX_PER_PAGE))
+
+
+def encode_cursor(sort_value, row_id):
+    """Gerar cursor opaco a partir da última linha da página"""
+    payload = json.dumps([sort_value.isoformat(), row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Ler (valor de ordenação, id) de um cursor"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except (ValueError, TypeError):
+        raise InvalidCursor(cursor)
+
+
+def keyset_paginate(query, sort_column, id_column, cursor=None, per_page=DEFAULT_PER_PAGE, with_total=False):
+    """
+    Página keyset em ordem decrescente de (sort_column, id_column).
+    Retorna (itens, metadados).
+    """
+    total = query.order_by(None).count() if with_total else None
+    
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            sort_column < sort_value,
+            and_(sort_column == sort_value, id_column < row_id)
+        ))
+    
+    query = query.order_by(None).order_by(sort_column.desc(), id_column.desc())
+    rows = query.limit(per_page + 1).all()
+    
+    has_more = len(rows) > per_page
+    items = rows[:per_page]
+    next_cursor = None
+    if has_more:
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    
+    return items, {
+        'total': total,
+        'per_page': per_page,
+        'next_cursor': next_cursor,
+        'has_more': has_more
+    }
+
+
+def paginate_request(query, sort_column, id_column):
+    """
+    Paginar uma query conforme os parâmetros da requisição.
+    Usa keyset quando 'cursor' está presente (vazio = primeira página),
+    senão page/per_page. Retorna (itens, metadados).
+    """
+    per_page = get_per_page()
+    
+    if 'cursor' in request.args:
+        cursor = request.args.get('cursor', '')
+        with_total = not cursor or request.args.get('include_total') in ('1', 'true')
+        return keyset_paginate(query, sort_column, id_column, cursor, per_page, with_total)
+    
+    page = request.args.get('page', 1, type=int)
+    query = query.order_by(None).order_by(sort_column.desc(), id_column.desc())
+    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    
+    return pagination.items, {
+        'total': pagination.total,
+        'pages': pagination.pages,
+        'current_page': page,
+        'per_page': per_page
+    }
@@ -0,0 +1,259 @@
+"""
+Índices de prefixo em memória para autocomplete
+
+Cada índice é um Catalog (ver catalogs.py): carregado com uma query,
+recarregado após commits no model observado ou após CATALOG_TTL segundos.
+O conteúdo é uma lista ordenada de chaves normalizadas (minúsculas, sem
+acentos); a busca por prefixo é um bisect, sem tocar no banco.
+
+Cada palavra do texto também entra como chave, então "tec" encontra
+"Acme Tecnologia".
+
+BackgroundPrefixIndex nunca consulta o banco na requisição: a reconstrução
+roda numa thread, disparada pelo commit que altera os models observados
+(ou pelo TTL), e as buscas seguem respondendo com a versão anterior até a
+nova ficar pronta. A primeira construção começa no registro do blueprint;
+só se ela ainda não terminou a busca espera por ela (até COLD_START_WAIT
+segundos).
+"""
+import heapq
+import threading
+import time
+from bisect import bisect_left
+from flask import current_app
+from sqlalchemy import func
+from src.config import db
+from src.models.job import normalize_key
+from src.services.catalogs import Catalog, watch_model
+
+MAX_SUGGESTIONS = 20
+# Espera máxima pela primeira construção (só enquanto o índice nunca foi carregado)
+COLD_START_WAIT = 2.0
+SHORT_PREFIX_LENGTH = 2
+
+
+class PrefixIndex(Catalog):
+    """Catálogo servido como lista ordenada de chaves para busca por prefixo"""
+    
+    def entries(self):
+        """Iterável de (texto, peso, item); item precisa ter 'id' único"""
+        raise NotImplementedError
+    
+    def load(self):
+        rows = []
+        for text, weight, item in self.entries():
+            key = normalize_key(text)
+            if not key:
+                continue
+            words = key.split(' ')
+            # Chave completa + uma chave a partir de cada palavra seguinte
+            for position in range(len(words)):
+                rows.append((' '.join(words[position:]), -weight, key, item['id'], item))
+        rows.sort(key=lambda row: row[:4])
+        keys = [row[0] for row in rows]
+        items = [(row[1], row[2], row[4]) for row in rows]
+        # Prefixos curtos casam com boa parte do índice: ranking pré-calculado
+        return keys, items, self._rank_short_prefixes(keys, items)
+    
+    def _rank_short_prefixes(self, keys, items):
+        candidates = {}
+        for key, entry in zip(keys, items):
+            for length in range(1, min(len(key), SHORT_PREFIX_LENGTH) + 1):
+                candidates.setdefault(key[:length], []).append(entry)
+        return {prefix: _rank(entries, MAX_SUGGESTIONS) for prefix, entries in candidates.items()}
+    
+    def search(self, prefix, limit=10):
+        """Itens cujo texto (ou alguma palavra dele) começa com prefix, mais pesados primeiro"""
+        key = normalize_key(prefix)
+        if not key:
+            return []
+        limit = max(1, min(limit, MAX_SUGGESTIONS))
+        keys, items, short = self.data()
+        if len(key) <= SHORT_PREFIX_LENGTH:
+            return short.get(key, [])[:limit]
+        start = bisect_left(keys, key)
+        end = bisect_left(keys, key + '\uffff', lo=start)
+        return _rank(items[start:end], limit)
+
+
+def _rank(entries, limit):
+    """Itens distintos (por id) de maior peso; empate pela ordem alfabética"""
+    best = {}
+    for entry in entries:
+        item_id = entry[2]['id']
+        if item_id not in best or entry[:2] < best[item_id][:2]:
+            best[item_id] = entry
+    return [entry[2] for entry in heapq.nsmallest(limit, best.values(), key=lambda entry: entry[:2])]
+
+
+class CompanyNameIndex(PrefixIndex):
+    """Nomes de empresas para GET /api/companies/autocomplete"""
+    
+    def model(self):
+        from src.models.company import Company
+        return Company
+    
+    def entries(self):
+        Company = self.model()
+        rows = db.session.query(
+            Company.id, Company.company_name, Company.logo_url, Company.city, Company.state
+        ).filter(Company.company_name.isnot(None)).all()
+        for company_id, name, logo_url, city, state in rows:
+            yield name, 0, {
+                'id': company_id,
+                'label': name,
+                'company_name': name,
+                'logo_url': logo_url,
+                'city': city,
+                'state': state
+            }
+
+
+class BackgroundPrefixIndex(PrefixIndex):
+    """PrefixIndex reconstruído em segundo plano; a leitura só espera o banco na partida a frio"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._app = None
+        self._refreshing = False
+        self._pending = False
+        self._ready = threading.Event()
+    
+    def models(self):
+        """Models cujas alterações commitadas disparam a reconstrução"""
+        return (self.model(),)
+    
+    def _watch(self):
+        if not self._watching:
+            with self._lock:
+                if not self._watching:
+                    for model in self.models():
+                        watch_model(model, self)
+                    self._watching = True
+    
+    def data(self):
+        """Conteúdo atual (possivelmente um pouco velho); agenda a reconstrução se preciso"""
+        self._watch()
+        if (
+            self._data is None
+            or self._loaded_version != self.version
+            or time.monotonic() - self._loaded_at >= self.ttl
+        ):
+            self.refresh_async()
+        if self._data is None and self._refreshing:
+            # Partida a frio (aquecimento do registro ainda rodando ou falhou)
+            self._ready.wait(COLD_START_WAIT)
+        return self._data or ([], [], {})
+    
+    def invalidate(self):
+        """
+        Nova versão; chamado pelo hook after_commit (ver catalogs.py), então a
+        reconstrução começa logo após o commit em vez de na próxima busca
+        """
+        super().invalidate()
+        # Sem app conhecido o índice nunca foi aquecido: a primeira busca constrói
+        if self._app is not None:
+            self.refresh_async()
+    
+    def refresh_async(self, app=None):
+        """
+        Reconstruir numa thread (no máximo uma por vez; um pedido durante a
+        reconstrução agenda mais uma rodada)
+        Chamado também no registro do blueprint, para aquecer o índice antes
+        da primeira requisição
+        """
+        self._watch()
+        # O hook after_commit pode rodar fora de um app context
+        app = app or self._app or current_app._get_current_object()
+        self._app = app
+        with self._lock:
+            if self._refreshing:
+                self._pending = True
+                return
+            self._refreshing = True
+        threading.Thread(target=self._rebuild, args=(app,), daemon=True).start()
+    
+    def _rebuild(self, app):
+        while True:
+            try:
+                with app.app_context():
+                    version = self.version
+                    data = self.load()
+                    db.session.remove()
+                self._data = data
+                self._loaded_version = version
+                self._loaded_at = time.monotonic()
+                self._ready.set()
+            except Exception:
+                app.logger.exception('Falha ao reconstruir o índice de sugestões')
+                self._loaded_at = time.monotonic()
+            with self._lock:
+                if not self._pending:
+                    self._refreshing = False
+                    return
+                self._pending = False
+
+
+class JobSuggestIndex(BackgroundPrefixIndex):
+    """
+    Sugestões de GET /api/jobs/suggest: títulos, skills, cidades e estados
+    das vagas ativas, pesados pelo número de vagas ativas que casam
+    """
+    
+    def model(self):
+        from src.models.job import Job
+        return Job
+    
+    def models(self):
+        from src.models.job import Job, JobSkill, Skill
+        return (Job, JobSkill, Skill)
+    
+    def entries(self):
+        from src.models.job import Job, JobSkill, Skill
+        active = Job.is_active.is_(True)
+        
+        # Títulos: variações de grafia agrupadas pela chave normalizada
+        titles = {}
+        for title, count in db.session.query(Job.title, func.count(Job.id)).filter(active).group_by(Job.title):
+            key = normalize_key(title)
+            if not key:
+                continue
+            total, label, label_count = titles.get(key, (0, title, 0))
+            if count > label_count:
+                label, label_count = title, count
+            titles[key] = (total + count, label, label_count)
+        for key, (count, label, _) in titles.items():
+            yield label, count, {'id': f'title:{key}', 'type': 'title', 'label': label, 'jobs_count': count}
+        
+        skills = db.session.query(Skill.id, Skill.name, func.count(JobSkill.job_id)).join(
+            JobSkill, JobSkill.skill_id == Skill.id
+        ).join(Job, Job.id == JobSkill.job_id).filter(active).group_by(Skill.id, Skill.name)
+        for skill_id, name, count in skills:
+            yield name, count, {
+                'id': f'skill:{skill_id}', 'type': 'skill', 'label': name,
+                'skill_id': skill_id, 'jobs_count': count
+            }
+        
+        # Cidades e estados agrupados pelas chaves normalizadas (mesmas dos filtros)
+        cities = db.session.query(
+            Job.city_key, Job.state_key, func.min(Job.city), func.min(Job.state), func.count(Job.id)
+        ).filter(active, Job.city_key.isnot(None)).group_by(Job.city_key, Job.state_key)
+        for city_key, state_key, city, state, count in cities:
+            yield city, count, {
+                'id': f'city:{city_key}:{state_key or ""}', 'type': 'city',
+                'label': f'{city}, {state}' if state else city,
+                'city': city, 'state': state, 'jobs_count': count
+            }
+        
+        states = db.session.query(
+            Job.state_key, func.min(Job.state), func.count(Job.id)
+        ).filter(active, Job.state_key.isnot(None)).group_by(Job.state_key)
+        for state_key, state, count in states:
+            yield state, count, {
+                'id': f'state:{state_key}', 'type': 'state', 'label': state,
+                'state': state, 'jobs_count': count
+            }
+
+
+company_name_index = CompanyNameIndex()
+job_suggest_index = JobSuggestIndex()
@@ -0,0 +1,126 @@
+"""
+Busca textual com índice full-text
+
+Cada FullTextIndex escolhe um backend conforme o banco em uso:
+- SQLite: tabela virtual FTS5 mantida por triggers
+  (ver migrations/add_jobs_fulltext_index.py e add_companies_fulltext_index.py)
+- PostgreSQL: to_tsvector/to_tsquery, servido por um índice GIN de expressão
+  (ver FullTextIndex.postgres_index_ddl), usado só se o índice existir
+- Qualquer outro caso (ex.: tabela FTS ainda não criada): ilike, como antes
+
+Os termos são quebrados em tokens e todos precisam casar, com prefixo
+("reac" encontra "React"). Palavras cujo sentido está nos símbolos
+("C++", "C#", ".NET") não sobrevivem à tokenização e casam por substring.
+"""
+import re
+from sqlalchemy import and_, or_, func, inspect, literal, literal_column, select, table
+from src.config import db
+from src.models.job import Job
+from src.models.company import Company
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+# Palavras que perdem o sentido sem os símbolos: "c++", "c#", ".net"
+LITERAL_WORD_RE = re.compile(r'[+#]|^\.')
+
+
+def tokenize(term):
+    """Quebrar o termo de busca em tokens seguros para MATCH/to_tsquery"""
+    return TOKEN_RE.findall((term or '').lower())
+
+
+def split_terms(term):
+    """Separar o termo em (tokens para o índice, palavras que casam literalmente)"""
+    tokens, literals = [], []
+    for word in (term or '').lower().split():
+        if LITERAL_WORD_RE.search(word):
+            literals.append(word)
+        else:
+            tokens.extend(tokenize(word))
+    return tokens, literals
+
+
+class FullTextIndex:
+    """Índice full-text sobre algumas colunas de texto de um model"""
+    
+    def __init__(self, model, fts_table, columns):
+        self.model = model
+        self.fts_table = fts_table
+        self.columns = columns
+        self._backends = {}
+    
+    @property
+    def postgres_index_ddl(self):
+        """DDL do índice GIN que serve o backend PostgreSQL"""
+        return (
+            f"CREATE INDEX IF NOT EXISTS {self.postgres_index_name} "
+            f"ON {self.model.__tablename__} USING GIN (to_tsvector('simple', {self._document_sql()}))"
+        )
+    
+    def _document_sql(self, qualified=False):
+        # Qualificado nas queries (a listagem faz JOIN com companies, que também
+        # tem description); o PostgreSQL resolve os nomes antes de comparar com
+        # a expressão do índice, então as duas formas usam o mesmo índice
+        prefix = f'{self.model.__tablename__}.' if qualified else ''
+        return " || ' ' || ".join(f"coalesce({prefix}{name}, '')" for name in self.columns)
+    
+    @property
+    def postgres_index_name(self):
+        return f'ix_{self.model.__tablename__}_fulltext'
+    
+    def backend(self):
+        """Backend disponível para o engine atual (detectado uma vez por engine)"""
+        engine = db.engine
+        key = str(engine.url)
+        if key not in self._backends:
+            dialect = engine.dialect.name
+            if dialect == 'sqlite' and inspect(engine).has_table(self.fts_table):
+                self._backends[key] = 'sqlite_fts5'
+            elif dialect == 'postgresql' and self.postgres_index_name in {
+                index['name'] for index in inspect(engine).get_indexes(self.model.__tablename__)
+            }:
+                # Sem o índice GIN, to_tsvector por linha seria mais lento que o ilike
+                self._backends[key] = 'postgresql'
+            else:
+                self._backends[key] = 'ilike'
+        return self._backends[key]
+    
+    def reset(self):
+        """Esquecer o backend detectado (ex.: após rodar a migration)"""
+        self._backends.clear()
+    
+    def filter(self, term):
+        """Expressão de filtro para usar em query.filter()"""
+        tokens, literals = split_terms(term)
+        if not (tokens or literals) or (tokens and self.backend() == 'ilike'):
+            # Sem índice: mesmo comportamento de antes
+            return self._substring_filter(term)
+        
+        conditions = [self._substring_filter(word) for word in literals]
+        if tokens:
+            conditions.append(self._token_filter(tokens))
+        return and_(*conditions)
+    
+    def _token_filter(self, tokens):
+        if self.backend() == 'sqlite_fts5':
+            match = ' '.join(f'"{token}"*' for token in tokens)
+            fts = table(self.fts_table)
+            matching_ids = select(literal_column('rowid')).select_from(fts).where(
+                literal_column(self.fts_table).op('MATCH')(literal(match))
+            )
+            return self.model.id.in_(matching_ids)
+        
+        # PostgreSQL: mesma expressão do índice GIN (postgres_index_ddl)
+        tsquery = ' & '.join(f'{token}:*' for token in tokens)
+        document = literal_column(self._document_sql(qualified=True))
+        return func.to_tsvector('simple', document).op('@@')(func.to_tsquery('simple', tsquery))
+    
+    def _substring_filter(self, text):
+        """Comportamento de antes do índice: ilike em qualquer coluna"""
+        return or_(*[getattr(self.model, name).ilike(f'%{text}%') for name in self.columns])
+
+
+# Índice usado pelos filtros q e tech de GET /api/jobs/
+jobs_fulltext = FullTextIndex(Job, 'jobs_fts', ('title', 'description', 'requirements'))
+
+# Índice usado pelo filtro q de GET /api/companies/search
+companies_fulltext = FullTextIndex(Company, 'companies_fts', ('company_name', 'description'))